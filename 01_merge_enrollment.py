@@ -14,6 +14,11 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.config import *
 from utils.helper_functions import *
+from utils.heavy_hitters import HeavyHitterTracker, print_heavy_hitters
+from utils.center_index import build_center_index, save_center_index
+from utils.partitioned_dataset import write_partitioned_dataset
+from utils.checkpoint import is_stage_complete, mark_stage_complete, clear_shard_checkpoints
+from utils.export_queue import BackgroundExporter
 
 def main():
     """Main function to merge enrollment files"""
@@ -22,9 +27,21 @@ def main():
     print("ENROLLMENT DATA MERGING")
     print("=" * 80)
     
+    # Skip if inputs and outputs are unchanged since the last run
+    input_files = resolve_input_files(ENROLLMENT_FILES, RAW_DATA_DIR)
+    input_paths = [os.path.join(RAW_DATA_DIR, f) for f in input_files]
+    stage = 'merge_enrollment'
+    if '--force' not in sys.argv and is_stage_complete(PIPELINE_CHECKPOINT_FILE, stage, input_paths):
+        print(f"\n✓ {stage} is up to date (use --force to re-run)")
+        return
+    
     # Load and merge files
-    print(f"\nLoading {len(ENROLLMENT_FILES)} enrollment files...")
-    merged_df = merge_csv_files(ENROLLMENT_FILES, RAW_DATA_DIR)
+    print(f"\nLoading {len(input_files)} enrollment files...")
+    trackers = [HeavyHitterTracker('pincode', 'num_enrollments'),
+                HeavyHitterTracker('registrar_id', 'num_enrollments')]
+    merged_df = merge_csv_files(input_files, RAW_DATA_DIR, trackers=trackers,
+                                quarantine_dir=QUARANTINE_DIR, workers=LOAD_WORKERS,
+                                checkpoint_dir=get_shard_checkpoint_dir('enrollment'))
     
     if merged_df is None:
         print("✗ Failed to merge files")
@@ -34,6 +51,7 @@ def main():
     print("\n--- Data Validation ---")
     check_missing_values(merged_df, "Enrollment Data")
     check_duplicates(merged_df, "Enrollment Data")
+    print_heavy_hitters(trackers, TOP_N_PINCODES)
     
     # Data info
     print_dataframe_info(merged_df, "Merged Enrollment Data")
@@ -49,9 +67,18 @@ def main():
     total_enrollments = merged_df['num_enrollments'].sum()
     print(f"\n✓ Total Enrollments: {format_number(total_enrollments)}")
     
-    # Save merged file
+    # Save merged file and center index in the background while partitions are written
     print(f"\nSaving merged data...")
-    save_dataframe(merged_df, MERGED_ENROLLMENT_FILE)
+    with BackgroundExporter(EXPORT_WORKERS, EXPORT_MAX_INFLIGHT_MB) as exporter:
+        exporter.save_dataframe(merged_df, MERGED_ENROLLMENT_FILE)
+        schema = SYSTEMS['enrollment']
+        center_index = build_center_index(merged_df, schema['center_column'], schema['date_column'],
+                                          schema['value_column'], START_DATE, END_DATE)
+        exporter.submit(save_center_index, center_index, get_center_index_path('enrollment'))
+        write_partitioned_dataset(merged_df, PARTITIONED_DATA_DIR, 'enrollment', schema['date_column'])
+    mark_stage_complete(PIPELINE_CHECKPOINT_FILE, stage, inputs=input_paths,
+                        outputs=[MERGED_ENROLLMENT_FILE, get_center_index_path('enrollment')])
+    clear_shard_checkpoints(get_shard_checkpoint_dir('enrollment'))
     
     # Summary statistics
     print("\n--- Summary Statistics ---")
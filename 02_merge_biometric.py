@@ -12,14 +12,30 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.config import *
 from utils.helper_functions import *
+from utils.heavy_hitters import HeavyHitterTracker, print_heavy_hitters
+from utils.center_index import build_center_index, save_center_index
+from utils.partitioned_dataset import write_partitioned_dataset
+from utils.checkpoint import is_stage_complete, mark_stage_complete, clear_shard_checkpoints
+from utils.export_queue import BackgroundExporter
 
 def main():
     print("=" * 80)
     print("BIOMETRIC DATA MERGING")
     print("=" * 80)
     
-    print(f"\nLoading {len(BIOMETRIC_FILES)} biometric files...")
-    merged_df = merge_csv_files(BIOMETRIC_FILES, RAW_DATA_DIR)
+    input_files = resolve_input_files(BIOMETRIC_FILES, RAW_DATA_DIR)
+    input_paths = [os.path.join(RAW_DATA_DIR, f) for f in input_files]
+    stage = 'merge_biometric'
+    if '--force' not in sys.argv and is_stage_complete(PIPELINE_CHECKPOINT_FILE, stage, input_paths):
+        print(f"\n✓ {stage} is up to date (use --force to re-run)")
+        return
+    
+    print(f"\nLoading {len(input_files)} biometric files...")
+    trackers = [HeavyHitterTracker('pincode', 'num_biometric_updates'),
+                HeavyHitterTracker('update_center_id', 'num_biometric_updates')]
+    merged_df = merge_csv_files(input_files, RAW_DATA_DIR, trackers=trackers,
+                                quarantine_dir=QUARANTINE_DIR, workers=LOAD_WORKERS,
+                                checkpoint_dir=get_shard_checkpoint_dir('biometric'))
     
     if merged_df is None:
         print("✗ Failed to merge files")
@@ -27,12 +43,22 @@ def main():
     
     check_missing_values(merged_df, "Biometric Data")
     check_duplicates(merged_df, "Biometric Data")
+    print_heavy_hitters(trackers, TOP_N_PINCODES)
     print_dataframe_info(merged_df, "Merged Biometric Data")
     
     total_updates = merged_df['num_biometric_updates'].sum()
     print(f"\n✓ Total Biometric Updates: {format_number(total_updates)}")
     
-    save_dataframe(merged_df, MERGED_BIOMETRIC_FILE)
+    with BackgroundExporter(EXPORT_WORKERS, EXPORT_MAX_INFLIGHT_MB) as exporter:
+        exporter.save_dataframe(merged_df, MERGED_BIOMETRIC_FILE)
+        schema = SYSTEMS['biometric']
+        center_index = build_center_index(merged_df, schema['center_column'], schema['date_column'],
+                                          schema['value_column'], START_DATE, END_DATE)
+        exporter.submit(save_center_index, center_index, get_center_index_path('biometric'))
+        write_partitioned_dataset(merged_df, PARTITIONED_DATA_DIR, 'biometric', schema['date_column'])
+    mark_stage_complete(PIPELINE_CHECKPOINT_FILE, stage, inputs=input_paths,
+                        outputs=[MERGED_BIOMETRIC_FILE, get_center_index_path('biometric')])
+    clear_shard_checkpoints(get_shard_checkpoint_dir('biometric'))
     
     print("\n--- Age Group Distribution ---")
     age_dist = merged_df.groupby('age_group')['num_biometric_updates'].sum()
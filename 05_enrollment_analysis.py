@@ -8,13 +8,22 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.config import *
 from utils.helper_functions import *
+from utils.columnar_cache import load_dataset_cached
 
 def main():
     print("ENROLLMENT SYSTEM ANALYSIS - Complete statistical analysis of enrollment data")
-    df = pd.read_csv(MERGED_ENROLLMENT_FILE)
+    df = load_dataset_cached(MERGED_ENROLLMENT_FILE, get_columnar_cache_path('enrollment'),
+                             parse_dates=['enrollment_date'])
+    if df is None:
+        return
     df = standardize_dates(df, 'enrollment_date')
     df = add_age_category(df, 'age')
     
+    # Distribution of enrollments for every state x age category in one pass
+    stats = batch_distribution_statistics(df, ['state', 'age_category'], 'num_enrollments',
+                                          PERCENTILES)
+    save_dataframe(stats, ENROLLMENT_STATS_FILE)
+    
     # Analysis logic here - see full code in repository
     print("Analysis completed successfully!")
 
@@ -0,0 +1,32 @@
+"""
+14_build_aggregates.py - Build aggregate cubes for the query service
+"""
+import pandas as pd
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.config import *
+from utils.helper_functions import *
+from utils.aggregate_cube import build_aggregate_cube, save_aggregate_cube
+from utils.export_queue import BackgroundExporter
+
+def main():
+    print("=" * 80)
+    print("BUILDING AGGREGATE CUBES")
+    print("=" * 80)
+    # Each cube is written while the next system is loaded and aggregated
+    with BackgroundExporter(EXPORT_WORKERS, EXPORT_MAX_INFLIGHT_MB) as exporter:
+        for system, schema in SYSTEMS.items():
+            print(f"\n--- {system.title()} ---")
+            df = load_csv_file(schema['merged_file'])
+            if df is None:
+                continue
+            cube = build_aggregate_cube(df, schema['value_column'], schema['date_column'],
+                                        schema['age_column'])
+            # save_aggregate_cube formats a full copy of the cube before writing
+            exporter.submit(save_aggregate_cube, cube, get_aggregate_cube_path(system),
+                            nbytes=int(cube.memory_usage(deep=True).sum()))
+    print("\n✓ AGGREGATE CUBES COMPLETED!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+15_query_service.py - Serve aggregate rollups to the dashboard on localhost
+
+Run 14_build_aggregates.py first. Example queries:
+    http://127.0.0.1:8765/rollup?system=enrollment&by=state&top=15
+    http://127.0.0.1:8765/rollup?system=demographic&by=date&state=Uttar Pradesh
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.config import *
+from utils.aggregate_cube import load_aggregate_cube
+from utils.query_service import run_query_service
+
+def main():
+    print("=" * 80)
+    print("AADHAAR QUERY SERVICE")
+    print("=" * 80)
+    cubes = {}
+    for system in SYSTEMS:
+        cube = load_aggregate_cube(get_aggregate_cube_path(system))
+        if cube is not None:
+            cubes[system] = cube
+    if not cubes:
+        print("✗ No aggregate cubes found - run 14_build_aggregates.py first")
+        return
+    run_query_service(cubes, QUERY_SERVICE_HOST, QUERY_SERVICE_PORT, QUERY_CACHE_SIZE,
+                      QUERY_SERVICE_ALLOWED_ORIGIN)
+
+if __name__ == "__main__":
+    main()
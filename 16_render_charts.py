@@ -0,0 +1,69 @@
+"""
+16_render_charts.py - Render standard charts from the aggregate cubes
+
+Usage:
+    python 16_render_charts.py            # full resolution, unchanged charts skipped
+    python 16_render_charts.py --preview  # fast low-DPI preview
+    python 16_render_charts.py --force    # re-render everything
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.config import *
+from utils.aggregate_cube import load_aggregate_cube, rollup_cube
+from utils.render_engine import chart_spec, render_charts, render_bar_chart, render_line_chart
+
+def build_chart_specs(system, cube):
+    """Chart specs for one system, aggregated once from its cube"""
+    title = system.title()
+    states = rollup_cube(cube, by=['state'], top_n=TOP_N_STATES)
+    # District names repeat across states, so roll up by both and label "District, State"
+    districts = rollup_cube(cube, by=['state', 'district'], top_n=TOP_N_DISTRICTS)
+    districts['label'] = districts['district'].astype(str) + ', ' + districts['state'].astype(str)
+    pincodes = rollup_cube(cube, by=['pincode'], top_n=TOP_N_PINCODES)
+    daily = rollup_cube(cube, by=['date'])
+    ages = rollup_cube(cube, by=['age_group'])
+    return [
+        chart_spec(f'{system}_top_states', render_bar_chart, states,
+                   label_column='state', value_column='total',
+                   title=f'{title} - Top {TOP_N_STATES} States'),
+        chart_spec(f'{system}_top_districts', render_bar_chart, districts,
+                   label_column='label', value_column='total',
+                   title=f'{title} - Top {TOP_N_DISTRICTS} Districts', color='secondary'),
+        chart_spec(f'{system}_top_pincodes', render_bar_chart, pincodes,
+                   label_column='pincode', value_column='total',
+                   title=f'{title} - Top {TOP_N_PINCODES} Pincodes', color='tertiary'),
+        chart_spec(f'{system}_daily_trend', render_line_chart, daily,
+                   x_column='date', value_column='total',
+                   title=f'{title} - Daily Trend ({ANALYSIS_PERIOD})'),
+        chart_spec(f'{system}_age_groups', render_bar_chart, ages,
+                   label_column='age_group', value_column='total',
+                   title=f'{title} - Age Group Distribution', size='small', horizontal=False)
+    ]
+
+def main():
+    preview = '--preview' in sys.argv
+    force = '--force' in sys.argv
+
+    print("=" * 80)
+    print("CHART RENDERING" + (" (PREVIEW)" if preview else ""))
+    print("=" * 80)
+
+    specs = []
+    for system in SYSTEMS:
+        cube = load_aggregate_cube(get_aggregate_cube_path(system))
+        if cube is not None:
+            specs.extend(build_chart_specs(system, cube))
+    if not specs:
+        print("✗ No aggregate cubes found - run 14_build_aggregates.py first")
+        return
+
+    summary = render_charts(specs, get_style_config(), VISUALIZATION_DIR,
+                            manifest_path=RENDER_MANIFEST_FILE, workers=RENDER_WORKERS,
+                            preview=preview, preview_dpi=PREVIEW_DPI, force=force)
+
+    print(f"\n✓ Rendered: {len(summary['rendered'])}  "
+          f"Skipped: {len(summary['skipped'])}  Failed: {len(summary['failed'])}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+17_time_series_report.py - Daily trends, anomalous days and day-of-week seasonality
+"""
+import pandas as pd
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.config import *
+from utils.helper_functions import *
+from utils.aggregate_cube import load_aggregate_cube
+from utils.time_series import (build_daily_panel, detect_anomalies, anomalies_to_frame,
+                               panel_to_frame, day_of_week_seasonality)
+from utils.export_queue import BackgroundExporter
+
+def main():
+    print("=" * 80)
+    print("DAILY TIME-SERIES REPORT")
+    print("=" * 80)
+
+    trends, anomalies, seasonality = [], [], []
+    for system in SYSTEMS:
+        cube = load_aggregate_cube(get_aggregate_cube_path(system))
+        if cube is None:
+            continue
+
+        for level in ['national', 'state', 'district']:
+            panel = build_daily_panel(cube, level, START_DATE, END_DATE)
+            baseline, z, flags = detect_anomalies(panel['values'], ANOMALY_BASELINE_DAYS,
+                                                  ANOMALY_Z_THRESHOLD)
+            flagged = anomalies_to_frame(panel, baseline, z, flags)
+            flagged.insert(0, 'level', level)
+            flagged.insert(0, 'system', system)
+            anomalies.append(flagged)
+            print(f"  {level}: {len(flagged):,} anomalous series-days")
+
+            if level == 'state':
+                trend = panel_to_frame(panel, ROLLING_WINDOW_DAYS)
+                trend.insert(0, 'system', system)
+                trends.append(trend)
+
+            if level in ('national', 'state'):
+                weekday = day_of_week_seasonality(panel['values'], panel['dates'])
+                keys = panel['keys'].rename(columns={'series': 'state'})
+                weekday.insert(0, 'state', keys['state'].to_numpy())
+                weekday.insert(0, 'level', level)
+                weekday.insert(0, 'system', system)
+                seasonality.append(weekday)
+
+    if not trends:
+        print("✗ No aggregate cubes found - run 14_build_aggregates.py first")
+        return
+
+    with BackgroundExporter(EXPORT_WORKERS, EXPORT_MAX_INFLIGHT_MB) as exporter:
+        exporter.save_dataframe(pd.concat(trends, ignore_index=True), DAILY_TRENDS_FILE)
+        exporter.save_dataframe(pd.concat(anomalies, ignore_index=True), DAILY_ANOMALIES_FILE)
+        exporter.save_dataframe(pd.concat(seasonality, ignore_index=True),
+                                DAY_OF_WEEK_SEASONALITY_FILE)
+    print("\n✓ TIME-SERIES REPORT COMPLETED!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+18_center_report.py - Busiest, idle and utilisation report per center
+"""
+import pandas as pd
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.config import *
+from utils.helper_functions import *
+from utils.center_index import (load_center_index, center_summary, busiest_centers,
+                                idle_centers, utilisation_distribution)
+from utils.export_queue import BackgroundExporter
+
+def main():
+    print("=" * 80)
+    print("CENTER OPERATIONS REPORT")
+    print("=" * 80)
+    with BackgroundExporter(EXPORT_WORKERS, EXPORT_MAX_INFLIGHT_MB) as exporter:
+        for system in SYSTEMS:
+            path = get_center_index_path(system)
+            if not os.path.exists(path):
+                print(f"✗ Center index not found: {path} - run the merge scripts first")
+                continue
+            index = load_center_index(path)
+
+            print(f"\n--- {system.title()}: Top {TOP_N_PINCODES} Busiest Centers ---")
+            print(busiest_centers(index, TOP_N_PINCODES).to_string(index=False))
+
+            idle = idle_centers(index, IDLE_CENTER_DAYS)
+            print(f"\n{system.title()}: {len(idle):,} centers idle for the last {IDLE_CENTER_DAYS} days")
+
+            print(f"\n--- {system.title()}: Utilisation Distribution ---")
+            print(utilisation_distribution(index, PERCENTILES).to_string(index=False))
+
+            exporter.save_dataframe(center_summary(index),
+                                    get_output_file_path(f'{system}_center_summary.csv'))
+            exporter.save_dataframe(idle, get_output_file_path(f'{system}_idle_centers.csv'))
+    print("\n✓ CENTER REPORT COMPLETED!")
+
+if __name__ == "__main__":
+    main()
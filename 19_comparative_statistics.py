@@ -0,0 +1,40 @@
+"""
+19_comparative_statistics.py - Batched distribution statistics across systems
+"""
+import pandas as pd
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.config import *
+from utils.helper_functions import *
+from utils.columnar_cache import load_dataset_cached
+
+def main():
+    print("=" * 80)
+    print("COMPARATIVE STATISTICS")
+    print("=" * 80)
+
+    datasets = {}
+    for system, schema in SYSTEMS.items():
+        df = load_dataset_cached(schema['merged_file'], get_columnar_cache_path(system),
+                                 columns=['state', schema['age_column'], schema['value_column']],
+                                 parse_dates=[schema['date_column']])
+        if df is None:
+            continue
+        if schema['age_column'] == 'age':
+            df = add_age_category(df, 'age')
+        else:
+            df = df.rename(columns={schema['age_column']: 'age_category'})
+        datasets[system] = (df, schema['value_column'])
+
+    if not datasets:
+        print("✗ No merged datasets found - run the merge scripts first")
+        return
+
+    # Every state x system x age category, sorted once per system
+    stats = comparative_distribution_statistics(datasets, ['state', 'age_category'], PERCENTILES)
+    save_dataframe(stats, COMPARATIVE_STATS_FILE)
+    print(f"\n✓ {len(stats):,} state × age category groups across {len(datasets)} systems")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Aggregate cube for UIDAI Hackathon 2025
+Pre-aggregated totals by state, district, pincode, date and age group
+"""
+
+import pandas as pd
+import numpy as np
+import os
+
+from utils.helper_functions import atomic_write_path, write_checksum
+
+# Dimensions and measures stored in every cube
+CUBE_DIMENSIONS = ['state', 'district', 'pincode', 'date', 'age_group']
+CUBE_MEASURES = ['total', 'num_records']
+
+# ============================================================================
+# CUBE CONSTRUCTION
+# ============================================================================
+
+def _age_group_series(df, age_column):
+    """
+    Return age group labels for the cube
+
+    Numeric ages (enrollment) are bucketed with the same boundaries as
+    categorize_age; existing age_group labels are used as-is.
+    """
+    if pd.api.types.is_numeric_dtype(df[age_column]):
+        return pd.cut(df[age_column], bins=[-np.inf, 5, 17, np.inf],
+                      labels=['0-5 years', '5-17 years', '18+ years'])
+    return df[age_column].astype('category')
+
+def _pincode_series(pincodes):
+    """
+    Six-digit pincode labels for the cube
+
+    A missing pincode makes the column float, so numeric pincodes go
+    through Int64 first ('110033', not '110033.0'); missing stay missing.
+    """
+    if pd.api.types.is_numeric_dtype(pincodes):
+        pincodes = pincodes.astype('Int64')
+    return pincodes.astype('string').str.zfill(6).astype('category')
+
+def build_aggregate_cube(df, value_column, date_column, age_column):
+    """
+    Build aggregate cube from a merged system dataset
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Merged system data
+    value_column : str
+        Column to aggregate (e.g. num_enrollments)
+    date_column : str
+        Date column name
+    age_column : str
+        Numeric age column or age group label column
+
+    Returns:
+    --------
+    pandas.DataFrame
+        One row per (state, district, pincode, date, age_group) with
+        'total' and 'num_records'
+    """
+    keys = pd.DataFrame({
+        'state': df['state'].astype('category'),
+        'district': df['district'].astype('category'),
+        'pincode': _pincode_series(df['pincode']),
+        'date': pd.to_datetime(df[date_column]).dt.normalize(),
+        'age_group': _age_group_series(df, age_column),
+        'total': df[value_column]
+    })
+
+    cube = keys.groupby(CUBE_DIMENSIONS, observed=True, sort=False, dropna=False).agg(
+        total=('total', 'sum'),
+        num_records=('total', 'size')
+    ).reset_index()
+
+    print(f"✓ Built aggregate cube: {len(df):,} records → {len(cube):,} cells")
+    return cube
+
+def save_aggregate_cube(cube, filepath):
+    """
+    Save aggregate cube to CSV (atomically, with a .sha256 sidecar)
+
+    Parameters:
+    -----------
+    cube : pandas.DataFrame
+    filepath : str
+        Output file path
+    """
+    out = cube.copy()
+    out['date'] = out['date'].dt.strftime('%Y-%m-%d')
+    with atomic_write_path(filepath) as tmp_path:
+        out.to_csv(tmp_path, index=False)
+    write_checksum(filepath)
+    print(f"✓ Saved aggregate cube: {filepath} ({len(cube):,} cells)")
+
+def load_aggregate_cube(filepath):
+    """
+    Load aggregate cube saved by save_aggregate_cube
+
+    Parameters:
+    -----------
+    filepath : str
+        Cube file path
+
+    Returns:
+    --------
+    pandas.DataFrame or None
+    """
+    if not os.path.exists(filepath):
+        print(f"✗ Aggregate cube not found: {filepath}")
+        return None
+
+    cube = pd.read_csv(filepath, dtype={'state': 'category', 'district': 'category',
+                                        'pincode': 'category', 'age_group': 'category'},
+                       parse_dates=['date'])
+    print(f"✓ Loaded aggregate cube: {filepath} ({len(cube):,} cells)")
+    return cube
+
+# ============================================================================
+# ROLLUP QUERIES
+# ============================================================================
+
+def filter_cube(cube, filters=None, start_date=None, end_date=None):
+    """
+    Select cube cells matching dimension filters and a date range
+
+    Parameters:
+    -----------
+    cube : pandas.DataFrame
+    filters : dict
+        Dimension name to a value or list of values
+    start_date, end_date : str or datetime
+        Inclusive date bounds
+
+    Returns:
+    --------
+    pandas.DataFrame
+    """
+    mask = np.ones(len(cube), dtype=bool)
+
+    for dim, values in (filters or {}).items():
+        if dim not in CUBE_DIMENSIONS or dim == 'date':
+            raise ValueError(f"Unknown filter dimension: {dim}")
+        if not isinstance(values, (list, tuple, set)):
+            values = [values]
+        mask &= cube[dim].isin([str(v) for v in values]).to_numpy()
+
+    if start_date is not None:
+        mask &= (cube['date'] >= pd.Timestamp(start_date)).to_numpy()
+    if end_date is not None:
+        mask &= (cube['date'] <= pd.Timestamp(end_date)).to_numpy()
+
+    return cube[mask]
+
+def rollup_cube(cube, by=None, filters=None, start_date=None, end_date=None, top_n=None):
+    """
+    Roll cube cells up to the requested dimensions
+
+    Parameters:
+    -----------
+    cube : pandas.DataFrame
+    by : list
+        Dimensions to group by (empty for a grand total)
+    filters : dict
+        Dimension filters, see filter_cube
+    start_date, end_date : str or datetime
+        Inclusive date bounds
+    top_n : int
+        Keep only the N largest groups by total
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Grouped totals with percentage of the filtered total
+    """
+    by = list(by or [])
+    unknown = [dim for dim in by if dim not in CUBE_DIMENSIONS]
+    if unknown:
+        raise ValueError(f"Unknown rollup dimension(s): {', '.join(unknown)}")
+
+    selected = filter_cube(cube, filters, start_date, end_date)
+
+    if not by:
+        result = pd.DataFrame({
+            'total': [selected['total'].sum()],
+            'num_records': [selected['num_records'].sum()]
+        })
+    else:
+        # Keep missing keys so every rollup adds up to the grand total
+        result = selected.groupby(by, observed=True, sort=False,
+                                  dropna=False)[CUBE_MEASURES].sum().reset_index()
+
+    grand_total = result['total'].sum()
+    result['percentage'] = result['total'] / grand_total * 100 if grand_total else 0.0
+
+    if top_n is not None:
+        result = result.nlargest(top_n, 'total')
+    elif 'date' in by:
+        result = result.sort_values(by)
+    else:
+        result = result.sort_values('total', ascending=False)
+
+    return result.reset_index(drop=True)
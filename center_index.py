@@ -0,0 +1,238 @@
+"""
+Center index for UIDAI Hackathon 2025
+Per-center (registrar_id / update_center_id) daily volumes, activity,
+geography and duplicate share as compact arrays, with operational queries
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.helper_functions import atomic_write_path
+
+# ============================================================================
+# INDEX CONSTRUCTION
+# ============================================================================
+
+def build_center_index(df, center_column, date_column, value_column,
+                       start_date=None, end_date=None):
+    """
+    Build the center index from a merged system dataset
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Merged system data
+    center_column : str
+        'registrar_id' (enrollment) or 'update_center_id' (updates)
+    date_column : str
+        Date column name
+    value_column : str
+        Volume column (e.g. num_enrollments)
+    start_date, end_date : str or datetime
+        Day range of the daily volume matrix (default: data min/max)
+
+    Returns:
+    --------
+    dict
+        center_ids, dates and per-center arrays: daily (centers × days),
+        total, records, active_days, duplicate_share, state and district
+        codes with their category lists
+    """
+    codes, center_ids = pd.factorize(df[center_column], sort=True)
+    dates = pd.to_datetime(df[date_column]).dt.normalize()
+
+    start = pd.Timestamp(start_date) if start_date is not None else dates.min()
+    end = pd.Timestamp(end_date) if end_date is not None else dates.max()
+    day_range = pd.date_range(start, end, freq='D')
+    num_centers, num_days = len(center_ids), len(day_range)
+
+    day = ((dates - start) // pd.Timedelta(days=1)).to_numpy()
+    valid = (codes >= 0) & (day >= 0) & (day < num_days)
+    # Missing volumes count as 0 (NaN weights would poison the integer matrix)
+    values = np.nan_to_num(pd.to_numeric(df[value_column], errors='coerce').to_numpy(dtype=float))
+
+    daily = np.bincount(codes[valid] * num_days + day[valid].astype(np.int64),
+                        weights=values[valid], minlength=num_centers * num_days)
+    daily = daily.reshape(num_centers, num_days)
+    daily = daily.astype(np.int32 if daily.max(initial=0) < np.iinfo(np.int32).max else np.int64)
+
+    known = codes >= 0
+    records = np.bincount(codes[known], minlength=num_centers)
+    duplicated = df.duplicated().to_numpy() & known
+    duplicate_share = np.bincount(codes[duplicated], minlength=num_centers) / np.maximum(records, 1)
+
+    # Primary geography = state/district with the most volume at the center
+    geo = pd.DataFrame({'code': codes, 'state': df['state'], 'district': df['district'],
+                        'value': values})[known]
+    geo = geo.groupby(['code', 'state', 'district'], observed=True, sort=False)['value'].sum()
+    geo = geo.reset_index().sort_values(['code', 'value'], ascending=[True, False])
+    geo = geo.drop_duplicates('code').set_index('code').reindex(np.arange(num_centers))
+    state_codes, states = pd.factorize(geo['state'], sort=True)
+    district_codes, districts = pd.factorize(geo['district'], sort=True)
+
+    index = {
+        'center_column': center_column,
+        'center_ids': np.asarray(center_ids),
+        'dates': day_range.to_numpy().astype('datetime64[D]'),
+        'daily': daily,
+        'total': daily.sum(axis=1, dtype=np.int64),
+        'records': records.astype(np.int32),
+        'active_days': (daily > 0).sum(axis=1).astype(np.int16),
+        'duplicate_share': duplicate_share.astype(np.float32),
+        'state_codes': state_codes.astype(np.int16),
+        'states': np.asarray(states, dtype=str),
+        'district_codes': district_codes.astype(np.int16),
+        'districts': np.asarray(districts, dtype=str)
+    }
+
+    print(f"✓ Built center index: {num_centers:,} centers × {num_days} days "
+          f"({daily.nbytes / 1024**2:.1f} MB)")
+    return index
+
+def save_center_index(index, filepath):
+    """
+    Save center index as an uncompressed .npz archive
+
+    Parameters:
+    -----------
+    index : dict
+    filepath : str
+        Output file path
+    """
+    arrays = dict(index)
+    arrays['center_column'] = np.array(index['center_column'])
+    if arrays['center_ids'].dtype == object:
+        arrays['center_ids'] = arrays['center_ids'].astype(str)
+    with atomic_write_path(filepath) as tmp_path:
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+    print(f"✓ Saved center index: {filepath} ({len(index['center_ids']):,} centers)")
+
+def load_center_index(filepath):
+    """
+    Load center index saved by save_center_index
+
+    Returns:
+    --------
+    dict
+    """
+    with np.load(filepath, allow_pickle=False) as archive:
+        index = {key: archive[key] for key in archive.files}
+    index['center_column'] = str(index['center_column'])
+    print(f"✓ Loaded center index: {filepath} ({len(index['center_ids']):,} centers)")
+    return index
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+def _center_frame(index, positions):
+    """Summary rows for the given center positions"""
+    positions = np.asarray(positions)
+    daily = index['daily'][positions]
+    num_days = daily.shape[1]
+    active = daily > 0
+    has_activity = active.any(axis=1)
+    first_day = np.where(has_activity, active.argmax(axis=1), -1)
+    last_day = np.where(has_activity, num_days - 1 - active[:, ::-1].argmax(axis=1), -1)
+
+    dates = pd.DatetimeIndex(index['dates'])
+    state_codes = index['state_codes'][positions]
+    district_codes = index['district_codes'][positions]
+    active_days = index['active_days'][positions]
+
+    return pd.DataFrame({
+        index['center_column']: index['center_ids'][positions],
+        'state': np.where(state_codes >= 0, index['states'][state_codes], None),
+        'district': np.where(district_codes >= 0, index['districts'][district_codes], None),
+        'total': index['total'][positions],
+        'records': index['records'][positions],
+        'active_days': active_days,
+        'utilisation': active_days / num_days * 100,
+        'avg_daily_volume': index['total'][positions] / np.maximum(active_days, 1),
+        'duplicate_share': index['duplicate_share'][positions] * 100,
+        'first_active': dates[first_day].where(first_day >= 0),
+        'last_active': dates[last_day].where(last_day >= 0)
+    })
+
+def center_summary(index):
+    """
+    Summary row for every center
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Center id, primary state/district, total, records, active_days,
+        utilisation (% of days active), avg_daily_volume (per active day),
+        duplicate_share (%), first_active and last_active
+    """
+    return _center_frame(index, np.arange(len(index['center_ids'])))
+
+def busiest_centers(index, n=15, by='total'):
+    """
+    N busiest centers using partial selection
+
+    Parameters:
+    -----------
+    index : dict
+    n : int
+        Number of centers
+    by : str
+        'total', 'records' or 'active_days'
+
+    Returns:
+    --------
+    pandas.DataFrame
+    """
+    values = index[by]
+    n = min(n, len(values))
+    if n == 0:
+        return _center_frame(index, [])
+    candidates = np.argpartition(values, len(values) - n)[-n:]
+    ordered = candidates[np.argsort(-values[candidates], kind='stable')]
+    return _center_frame(index, ordered)
+
+def idle_centers(index, recent_days=30):
+    """
+    Centers with activity earlier in the period but none in the last recent_days
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Idle centers with days_idle, longest idle first
+    """
+    daily = index['daily']
+    recent_volume = daily[:, -recent_days:].sum(axis=1)
+    earlier_volume = daily[:, :-recent_days].sum(axis=1)
+    positions = np.nonzero((recent_volume == 0) & (earlier_volume > 0))[0]
+
+    result = _center_frame(index, positions)
+    result['days_idle'] = (pd.Timestamp(index['dates'][-1]) - result['last_active']).dt.days
+    return result.sort_values('days_idle', ascending=False).reset_index(drop=True)
+
+def utilisation_distribution(index, percentiles=(0.25, 0.50, 0.75, 0.95, 0.99), by_state=False):
+    """
+    Distribution of center utilisation and throughput
+
+    Parameters:
+    -----------
+    index : dict
+    percentiles : list
+        Quantiles to report
+    by_state : bool
+        Report one distribution per primary state
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Quantiles of active_days, utilisation, total and avg_daily_volume
+    """
+    summary = center_summary(index)
+    metrics = ['active_days', 'utilisation', 'total', 'avg_daily_volume']
+    if by_state:
+        result = summary.groupby('state')[metrics].quantile(list(percentiles))
+        result.index.names = ['state', 'percentile']
+        return result.reset_index()
+    result = summary[metrics].quantile(list(percentiles))
+    result.index.name = 'percentile'
+    return result.reset_index()
@@ -0,0 +1,162 @@
+"""
+Checkpoints for UIDAI Hackathon 2025
+Resumable long runs: completed stages and loaded shards are recorded so an
+interrupted run picks up where it stopped instead of starting from raw data
+"""
+
+import json
+import os
+import re
+from datetime import datetime
+
+import pandas as pd
+
+from utils.helper_functions import atomic_write_path, checksum_path, file_checksum, write_checksum
+
+# ============================================================================
+# FILE SIGNATURES
+# ============================================================================
+
+def file_signature(filepath):
+    """Cheap change detector for inputs: size and modification time"""
+    stat = os.stat(filepath)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def _recorded_checksum(filepath):
+    """Digest from the file's .sha256 sidecar, writing one if missing"""
+    sidecar = checksum_path(filepath)
+    if os.path.exists(sidecar):
+        with open(sidecar, 'r', encoding='utf-8') as f:
+            return f.read().split()[0]
+    return write_checksum(filepath)
+
+# ============================================================================
+# STAGE CHECKPOINTS
+# ============================================================================
+
+def load_checkpoint(checkpoint_file):
+    """Load the checkpoint file (empty if missing or unreadable)"""
+    try:
+        with open(checkpoint_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'stages': {}}
+
+def _save_checkpoint(checkpoint, checkpoint_file):
+    with atomic_write_path(checkpoint_file) as tmp_path:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f, indent=2, sort_keys=True)
+
+def mark_stage_complete(checkpoint_file, stage, inputs=(), outputs=()):
+    """
+    Record a stage as completed
+
+    Parameters:
+    -----------
+    checkpoint_file : str
+        Checkpoint JSON path
+    stage : str
+        Stage name (e.g. 'merge_enrollment')
+    inputs : list
+        Files the stage read (signatures are recorded)
+    outputs : list
+        Files the stage wrote (sizes and checksums are recorded)
+    """
+    checkpoint = load_checkpoint(checkpoint_file)
+    checkpoint['stages'][stage] = {
+        'completed_at': datetime.now().isoformat(timespec='seconds'),
+        'inputs': {path: file_signature(path) for path in inputs},
+        'outputs': {path: {'size': os.path.getsize(path), 'sha256': _recorded_checksum(path)}
+                    for path in outputs}
+    }
+    _save_checkpoint(checkpoint, checkpoint_file)
+    print(f"✓ Checkpoint: stage '{stage}' completed")
+
+def is_stage_complete(checkpoint_file, stage, inputs=None, verify=False):
+    """
+    Check whether a stage can be skipped
+
+    A stage is complete when it was recorded, its inputs are the same files
+    unchanged and every output still exists with its recorded size and
+    checksum.
+
+    Parameters:
+    -----------
+    checkpoint_file : str
+        Checkpoint JSON path
+    stage : str
+        Stage name
+    inputs : list
+        Files the stage would read now (detects added/removed inputs)
+    verify : bool
+        Re-hash outputs instead of trusting their size and sidecar
+
+    Returns:
+    --------
+    bool
+    """
+    entry = load_checkpoint(checkpoint_file)['stages'].get(stage)
+    if entry is None:
+        return False
+    if inputs is not None and set(inputs) != set(entry['inputs']):
+        return False
+
+    for path, signature in entry['inputs'].items():
+        if not os.path.exists(path) or file_signature(path) != signature:
+            return False
+
+    for path, recorded in entry['outputs'].items():
+        if not os.path.exists(path) or not os.path.exists(checksum_path(path)):
+            return False
+        if os.path.getsize(path) != recorded['size']:
+            return False
+        current = file_checksum(path) if verify else _recorded_checksum(path)
+        if current != recorded['sha256']:
+            return False
+
+    return True
+
+def clear_stage(checkpoint_file, stage):
+    """Forget a stage so it runs again"""
+    checkpoint = load_checkpoint(checkpoint_file)
+    if checkpoint['stages'].pop(stage, None) is not None:
+        _save_checkpoint(checkpoint, checkpoint_file)
+
+# ============================================================================
+# SHARD CHECKPOINTS
+# ============================================================================
+
+def _shard_checkpoint_path(checkpoint_dir, filepath):
+    signature = file_signature(filepath)
+    name = os.path.basename(filepath)
+    return os.path.join(checkpoint_dir, f"{name}.{signature['size']}_{signature['mtime_ns']}.pkl")
+
+def load_shard_checkpoint(checkpoint_dir, filepath):
+    """Parsed shard saved by a previous run, or None if missing/stale"""
+    path = _shard_checkpoint_path(checkpoint_dir, filepath)
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_pickle(path)
+    except Exception as e:
+        print(f"⚠ Ignoring unreadable shard checkpoint {path}: {e}")
+        return None
+
+def save_shard_checkpoint(checkpoint_dir, filepath, df):
+    """Save a parsed shard so a restarted run can skip re-parsing it"""
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    path = _shard_checkpoint_path(checkpoint_dir, filepath)
+    stale = re.compile(re.escape(os.path.basename(filepath)) + r'\.\d+_\d+\.pkl$')
+    for entry in os.listdir(checkpoint_dir):
+        if stale.match(entry):
+            os.remove(os.path.join(checkpoint_dir, entry))
+    with atomic_write_path(path) as tmp_path:
+        df.to_pickle(tmp_path)
+
+def clear_shard_checkpoints(checkpoint_dir):
+    """Remove all shard checkpoints once their stage has completed"""
+    if not os.path.isdir(checkpoint_dir):
+        return
+    for entry in os.listdir(checkpoint_dir):
+        if entry.endswith('.pkl'):
+            os.remove(os.path.join(checkpoint_dir, entry))
@@ -0,0 +1,179 @@
+"""
+Columnar cache for UIDAI Hackathon 2025
+Memory-mapped .npy column store so repeated (and concurrent) analysis runs
+share page-cache-backed, zero-copy views of the processed datasets
+"""
+
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+CACHE_FORMAT_VERSION = 1
+META_FILENAME = 'meta.json'
+
+# ============================================================================
+# CACHE KEYS
+# ============================================================================
+
+def _source_token(source_path):
+    """Identify a source file version by size and modification time"""
+    stat = os.stat(source_path)
+    return f"v{CACHE_FORMAT_VERSION}_{stat.st_size}_{stat.st_mtime_ns}"
+
+def _codes_dtype(num_categories):
+    """Smallest code dtype, matching what pandas uses for Categorical codes"""
+    for dtype in (np.int8, np.int16, np.int32):
+        if num_categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+# ============================================================================
+# CACHE BUILD / LOAD
+# ============================================================================
+
+def build_columnar_cache(df, cache_dir, source_path):
+    """
+    Write a DataFrame as one .npy file per column
+
+    Numeric, boolean and datetime columns are stored as-is; text columns
+    are dictionary-encoded (codes .npy + categories in meta.json). The
+    cache is written to a temporary directory and renamed into place, so
+    readers never see a partial cache.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+    cache_dir : str
+        Cache root for this dataset
+    source_path : str
+        File the data was loaded from (used to detect stale caches)
+
+    Returns:
+    --------
+    str
+        Directory holding the cache version
+    """
+    token = _source_token(source_path)
+    final_dir = os.path.join(cache_dir, token)
+    if os.path.exists(os.path.join(final_dir, META_FILENAME)):
+        return final_dir
+
+    tmp_dir = os.path.join(cache_dir, f".tmp-{token}-{os.getpid()}")
+    os.makedirs(tmp_dir, exist_ok=True)
+
+    columns = []
+    for i, name in enumerate(df.columns):
+        series = df[name]
+        entry = {'name': str(name), 'file': f'col_{i:03d}.npy'}
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biufM':
+            entry['kind'] = 'array'
+            values = series.to_numpy()
+        else:
+            categorical = series.astype('category').array
+            categories = categorical.categories
+            entry['kind'] = 'category'
+            entry['categories'] = [str(c) for c in categories]
+            values = categorical.codes.astype(_codes_dtype(len(categories)))
+        np.save(os.path.join(tmp_dir, entry['file']), values, allow_pickle=False)
+        columns.append(entry)
+
+    meta = {'version': CACHE_FORMAT_VERSION, 'rows': len(df), 'columns': columns,
+            'source': os.path.abspath(source_path)}
+    with open(os.path.join(tmp_dir, META_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+    try:
+        os.rename(tmp_dir, final_dir)
+    except OSError:
+        # Another process finished the same cache version first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    # Drop superseded versions (open memory maps stay valid after unlink)
+    for entry in os.listdir(cache_dir):
+        if entry != token and not entry.startswith('.tmp-'):
+            shutil.rmtree(os.path.join(cache_dir, entry), ignore_errors=True)
+
+    print(f"✓ Built columnar cache: {final_dir} ({len(df):,} rows, {len(columns)} columns)")
+    return final_dir
+
+def load_columnar_cache(version_dir, columns=None):
+    """
+    Open a cache version as a DataFrame of memory-mapped columns
+
+    Columns are read-only views onto the page cache; replacing a column
+    (df[col] = ...) is fine, in-place modification is not.
+
+    Parameters:
+    -----------
+    version_dir : str
+        Directory returned by build_columnar_cache
+    columns : list
+        Subset of columns to open (default: all)
+
+    Returns:
+    --------
+    pandas.DataFrame
+    """
+    with open(os.path.join(version_dir, META_FILENAME), 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+
+    data = {}
+    for entry in meta['columns']:
+        if columns is not None and entry['name'] not in columns:
+            continue
+        values = np.load(os.path.join(version_dir, entry['file']), mmap_mode='r')
+        if entry['kind'] == 'category':
+            dtype = pd.CategoricalDtype(entry['categories'])
+            values = pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+        data[entry['name']] = values
+
+    return pd.DataFrame(data, copy=False)
+
+def find_columnar_cache(cache_dir, source_path):
+    """Return the cache version directory for source_path, or None if stale/missing"""
+    version_dir = os.path.join(cache_dir, _source_token(source_path))
+    if os.path.exists(os.path.join(version_dir, META_FILENAME)):
+        return version_dir
+    return None
+
+def load_dataset_cached(source_path, cache_dir, columns=None, parse_dates=None):
+    """
+    Load a processed CSV through the columnar cache
+
+    The first call (or the first after the CSV changes) parses the CSV and
+    builds the cache; later calls, including from concurrent processes,
+    memory-map the cached columns instead.
+
+    Parameters:
+    -----------
+    source_path : str
+        Processed CSV (e.g. MERGED_ENROLLMENT_FILE)
+    cache_dir : str
+        Cache root for this dataset
+    columns : list
+        Subset of columns to return (default: all)
+    parse_dates : list
+        Date columns to store as datetime64 when building the cache
+
+    Returns:
+    --------
+    pandas.DataFrame or None
+    """
+    if not os.path.exists(source_path):
+        print(f"✗ Error loading {source_path}: file not found")
+        return None
+
+    version_dir = find_columnar_cache(cache_dir, source_path)
+    if version_dir is None:
+        print(f"Building columnar cache for {source_path}...")
+        df = pd.read_csv(source_path, parse_dates=parse_dates)
+        os.makedirs(cache_dir, exist_ok=True)
+        version_dir = build_columnar_cache(df, cache_dir, source_path)
+        del df
+
+    df = load_columnar_cache(version_dir, columns)
+    print(f"✓ Loaded {source_path} from columnar cache: {len(df):,} records")
+    return df
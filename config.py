@@ -18,38 +18,38 @@ VISUALIZATION_DIR = os.path.join(OUTPUT_DIR, 'visualizations')
 # Data subdirectories
 RAW_DATA_DIR = os.path.join(DATA_DIR, 'raw')
 PROCESSED_DATA_DIR = os.path.join(DATA_DIR, 'processed')
+QUARANTINE_DIR = os.path.join(DATA_DIR, 'quarantine')  # Rows rejected while loading
+CHECKPOINT_DIR = os.path.join(DATA_DIR, 'checkpoints')  # Resumable run state
+AGGREGATE_DIR = os.path.join(PROCESSED_DATA_DIR, 'aggregates')
+COLUMNAR_CACHE_DIR = os.path.join(PROCESSED_DATA_DIR, 'columnar')
+PARTITIONED_DATA_DIR = os.path.join(PROCESSED_DATA_DIR, 'partitioned')  # system=/state=/month=
 
 # Create directories if they don't exist
-for directory in [DATA_DIR, OUTPUT_DIR, VISUALIZATION_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR]:
+for directory in [DATA_DIR, OUTPUT_DIR, VISUALIZATION_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR,
+                  QUARANTINE_DIR, CHECKPOINT_DIR, AGGREGATE_DIR, COLUMNAR_CACHE_DIR, PARTITIONED_DATA_DIR]:
     os.makedirs(directory, exist_ok=True)
 
 # ============================================================================
 # INPUT FILE PATHS
 # ============================================================================
 
-# Enrollment System Files
-ENROLLMENT_FILES = [
-    'api_data_aadhar_0_350000.csv',
-    'api_data_aadhar_350000_700000.csv',
-    'api_data_aadhar_700000_1006029.csv'
-]
+# Shards may be plain CSV or compressed (.csv.gz, .csv.zst, .zip) and are
+# listed as glob patterns, so new range files are picked up automatically.
+# Only these exact extensions match, so sidecars (.sha256) and partial
+# downloads (.tmp, .part) are never read as shards.
+SHARD_EXTENSIONS = ['.csv', '.csv.gz', '.csv.zst', '.zip']
 
-# Biometric System Files
-BIOMETRIC_FILES = [
-    'api_data_aadhar_biometric_0_500000.csv',
-    'api_data_aadhar_biometric_500000_1000000.csv',
-    'api_data_aadhar_biometric_1000000_1500000.csv',
-    'api_data_aadhar_biometric_1500000_1861108.csv'
-]
+# Enrollment System Files (e.g. api_data_aadhar_0_350000.csv)
+ENROLLMENT_FILES = [f'api_data_aadhar_[0-9]*_[0-9]*{ext}' for ext in SHARD_EXTENSIONS]
 
-# Demographic System Files
-DEMOGRAPHIC_FILES = [
-    'api_data_aadhar_demographic_0_500000.csv',
-    'api_data_aadhar_demographic_500000_1000000.csv',
-    'api_data_aadhar_demographic_1000000_1500000.csv',
-    'api_data_aadhar_demographic_1500000_2000000.csv',
-    'api_data_aadhar_demographic_2000000_2071700.csv'
-]
+# Biometric System Files (e.g. api_data_aadhar_biometric_0_500000.csv)
+BIOMETRIC_FILES = [f'api_data_aadhar_biometric_*{ext}' for ext in SHARD_EXTENSIONS]
+
+# Demographic System Files (e.g. api_data_aadhar_demographic_0_500000.csv)
+DEMOGRAPHIC_FILES = [f'api_data_aadhar_demographic_*{ext}' for ext in SHARD_EXTENSIONS]
+
+# Processes used to decompress and parse shards (1 = serial)
+LOAD_WORKERS = 1
 
 # ============================================================================
 # OUTPUT FILE PATHS
@@ -60,12 +60,24 @@ MERGED_ENROLLMENT_FILE = os.path.join(PROCESSED_DATA_DIR, 'merged_enrollment_dat
 MERGED_BIOMETRIC_FILE = os.path.join(PROCESSED_DATA_DIR, 'merged_biometric_data.csv')
 MERGED_DEMOGRAPHIC_FILE = os.path.join(PROCESSED_DATA_DIR, 'merged_demographic_data.csv')
 
+# Completed pipeline stages
+PIPELINE_CHECKPOINT_FILE = os.path.join(CHECKPOINT_DIR, 'pipeline_checkpoint.json')
+
 # Analysis output files
 ENROLLMENT_STATS_FILE = os.path.join(OUTPUT_DIR, 'enrollment_statistics.csv')
 BIOMETRIC_STATS_FILE = os.path.join(OUTPUT_DIR, 'biometric_statistics.csv')
 DEMOGRAPHIC_STATS_FILE = os.path.join(OUTPUT_DIR, 'demographic_statistics.csv')
 COMPARATIVE_STATS_FILE = os.path.join(OUTPUT_DIR, 'comparative_statistics.csv')
 
+# Time-series output files
+DAILY_TRENDS_FILE = os.path.join(OUTPUT_DIR, 'daily_state_trends.csv')
+DAILY_ANOMALIES_FILE = os.path.join(OUTPUT_DIR, 'daily_anomalies.csv')
+DAY_OF_WEEK_SEASONALITY_FILE = os.path.join(OUTPUT_DIR, 'day_of_week_seasonality.csv')
+
+# Background export queue (see export_queue.BackgroundExporter)
+EXPORT_WORKERS = 4                # Threads writing outputs
+EXPORT_MAX_INFLIGHT_MB = 1024     # Buffers/copies queued exports may hold before submit blocks
+
 # ============================================================================
 # DATA SCHEMA
 # ============================================================================
@@ -88,6 +100,31 @@ DEMOGRAPHIC_COLUMNS = [
     'age_group', 'num_demographic_updates', 'update_date'
 ]
 
+# Column roles per system (used by the aggregate cube and query service)
+SYSTEMS = {
+    'enrollment': {
+        'merged_file': MERGED_ENROLLMENT_FILE,
+        'value_column': 'num_enrollments',
+        'date_column': 'enrollment_date',
+        'age_column': 'age',
+        'center_column': 'registrar_id'
+    },
+    'biometric': {
+        'merged_file': MERGED_BIOMETRIC_FILE,
+        'value_column': 'num_biometric_updates',
+        'date_column': 'update_date',
+        'age_column': 'age_group',
+        'center_column': 'update_center_id'
+    },
+    'demographic': {
+        'merged_file': MERGED_DEMOGRAPHIC_FILE,
+        'value_column': 'num_demographic_updates',
+        'date_column': 'update_date',
+        'age_column': 'age_group',
+        'center_column': 'update_center_id'
+    }
+}
+
 # ============================================================================
 # AGE GROUP DEFINITIONS
 # ============================================================================
@@ -116,6 +153,14 @@ END_DATE = '2025-12-31'
 PERCENTILES = [0.25, 0.50, 0.75, 0.95, 0.99]
 IQR_MULTIPLIER = 1.5  # For outlier detection
 
+# Time-series parameters
+ROLLING_WINDOW_DAYS = 7
+ANOMALY_BASELINE_DAYS = 28   # Trailing days each day is compared against
+ANOMALY_Z_THRESHOLD = 3.0
+
+# Center operations
+IDLE_CENTER_DAYS = 30        # No activity in the last N days = idle
+
 # Top N parameters
 TOP_N_STATES = 15
 TOP_N_DISTRICTS = 15
@@ -155,6 +200,11 @@ FONT_SIZE_TITLE = 16
 FONT_SIZE_LABEL = 12
 FONT_SIZE_TICK = 10
 
+# Rendering engine
+PREVIEW_DPI = 72                  # Fast low-resolution preview mode
+RENDER_WORKERS = None             # Process pool size (None = CPU count)
+RENDER_MANIFEST_FILE = os.path.join(VISUALIZATION_DIR, 'render_manifest.json')
+
 # ============================================================================
 # DATA QUALITY THRESHOLDS
 # ============================================================================
@@ -179,6 +229,15 @@ HACKATHON_NAME = "UIDAI HACKATHON 2025"
 ANALYSIS_PERIOD = "March - December 2025"
 TOTAL_DAYS = 304
 
+# ============================================================================
+# QUERY SERVICE SETTINGS
+# ============================================================================
+
+QUERY_SERVICE_HOST = '127.0.0.1'  # Local only
+QUERY_SERVICE_PORT = 8765
+QUERY_CACHE_SIZE = 512            # Cached responses (LRU)
+QUERY_SERVICE_ALLOWED_ORIGIN = 'http://localhost:5173'  # Dashboard dev server (CORS)
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
@@ -195,6 +254,39 @@ def get_visualization_path(filename):
     """Get full path for visualization file"""
     return os.path.join(VISUALIZATION_DIR, filename)
 
+def get_aggregate_cube_path(system):
+    """Get full path for a system's aggregate cube file"""
+    return os.path.join(AGGREGATE_DIR, f'{system}_aggregate_cube.csv')
+
+def get_center_index_path(system):
+    """Get full path for a system's center index file"""
+    return os.path.join(PROCESSED_DATA_DIR, f'{system}_center_index.npz')
+
+def get_shard_checkpoint_dir(system):
+    """Get directory for a system's parsed-shard checkpoints"""
+    return os.path.join(CHECKPOINT_DIR, system)
+
+def get_columnar_cache_path(system):
+    """Get cache root for a system's memory-mapped columnar cache"""
+    return os.path.join(COLUMNAR_CACHE_DIR, system)
+
+def get_style_config():
+    """Get visualization style settings passed to chart render functions"""
+    return {
+        'dpi': FIGURE_DPI,
+        'figure_size_large': FIGURE_SIZE_LARGE,
+        'figure_size_medium': FIGURE_SIZE_MEDIUM,
+        'figure_size_small': FIGURE_SIZE_SMALL,
+        'colors': COLORS,
+        'color_scheme_enrollment': COLOR_SCHEME_ENROLLMENT,
+        'color_scheme_biometric': COLOR_SCHEME_BIOMETRIC,
+        'color_scheme_demographic': COLOR_SCHEME_DEMOGRAPHIC,
+        'font_family': FONT_FAMILY,
+        'font_size_title': FONT_SIZE_TITLE,
+        'font_size_label': FONT_SIZE_LABEL,
+        'font_size_tick': FONT_SIZE_TICK
+    }
+
 # ============================================================================
 # PRINT CONFIGURATION SUMMARY
 # ============================================================================
@@ -207,9 +299,9 @@ def print_config():
     print(f"\nBase Directory: {BASE_DIR}")
     print(f"Data Directory: {DATA_DIR}")
     print(f"Output Directory: {OUTPUT_DIR}")
-    print(f"\nEnrollment Files: {len(ENROLLMENT_FILES)}")
-    print(f"Biometric Files: {len(BIOMETRIC_FILES)}")
-    print(f"Demographic Files: {len(DEMOGRAPHIC_FILES)}")
+    print(f"\nEnrollment Files: {', '.join(ENROLLMENT_FILES)}")
+    print(f"Biometric Files: {', '.join(BIOMETRIC_FILES)}")
+    print(f"Demographic Files: {', '.join(DEMOGRAPHIC_FILES)}")
     print(f"\nAnalysis Period: {START_DATE} to {END_DATE}")
     print(f"Total Days: {TOTAL_DAYS}")
     print(f"\nVisualization DPI: {FIGURE_DPI}")
@@ -0,0 +1,140 @@
+"""
+Background export queue for UIDAI Hackathon 2025
+Serialise and write outputs on a thread pool while computation continues,
+with a cap on the memory held by queued exports
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.helper_functions import write_dataframe
+
+# pandas to_csv renders ~100,000 cells per chunk as Python strings
+CSV_CHUNK_CELLS = 100_000
+CSV_CELL_BYTES = 64
+
+def csv_buffer_bytes(df, index=False):
+    """Approximate memory to_csv allocates while writing df (one rendered chunk)"""
+    num_columns = len(df.columns) + (df.index.nlevels if index else 0)
+    chunk_rows = min(len(df), max(CSV_CHUNK_CELLS // max(num_columns, 1), 1))
+    return chunk_rows * num_columns * CSV_CELL_BYTES
+
+# ============================================================================
+# EXPORT QUEUE
+# ============================================================================
+
+class BackgroundExporter:
+    """
+    Thread pool that writes outputs in the background
+
+    Each export declares the memory it adds while queued or running
+    (serialisation buffers, copies it makes - not data the caller already
+    holds). Submitting blocks while exports already hold more than
+    max_inflight_mb. An export larger than the whole cap runs outside the
+    shared budget, one at a time, so it never holds up small exports.
+    flush() waits for every export and re-raises the first failure; using
+    the exporter as a context manager flushes on exit.
+
+    DataFrames are queued as shallow copies: the caller may keep working
+    with (and reassigning columns of) the original, but should not modify
+    its values in place until flush().
+    """
+
+    def __init__(self, workers=4, max_inflight_mb=1024):
+        self.max_inflight_bytes = int(max_inflight_mb * 1024 ** 2)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='export')
+        self._condition = threading.Condition()
+        self._inflight_bytes = 0
+        self._oversized_running = False
+        self._futures = []
+        self._errors = []
+
+    def _acquire(self, nbytes):
+        """Wait for budget; returns True if the export is oversized"""
+        with self._condition:
+            if nbytes > self.max_inflight_bytes:
+                while self._oversized_running:
+                    self._condition.wait()
+                self._oversized_running = True
+                return True
+            while self._inflight_bytes + nbytes > self.max_inflight_bytes:
+                self._condition.wait()
+            self._inflight_bytes += nbytes
+            return False
+
+    def _release(self, nbytes, oversized, label):
+        def done(future):
+            error = future.exception()
+            with self._condition:
+                if oversized:
+                    self._oversized_running = False
+                else:
+                    self._inflight_bytes -= nbytes
+                if error is not None:
+                    self._errors.append(error)
+                self._condition.notify_all()
+            if error is not None:
+                print(f"✗ Export failed: {label}: {error}")
+        return done
+
+    def _raise_first_error(self):
+        with self._condition:
+            error = self._errors[0] if self._errors else None
+        if error is not None:
+            raise error
+
+    def submit(self, func, *args, nbytes=0, label=None, **kwargs):
+        """
+        Queue func(*args, **kwargs) on the export pool
+
+        Parameters:
+        -----------
+        func : callable
+            Writer to run in the background
+        nbytes : int
+            Memory the export adds until it finishes (counts against
+            max_inflight_mb)
+        label : str
+            Name used in error messages
+
+        Returns:
+        --------
+        concurrent.futures.Future
+        """
+        self._raise_first_error()
+        oversized = self._acquire(nbytes)
+        future = self._pool.submit(func, *args, **kwargs)
+        future.add_done_callback(self._release(nbytes, oversized,
+                                               label or getattr(func, '__name__', 'export')))
+        self._futures.append(future)
+        return future
+
+    def save_dataframe(self, df, filepath, index=False, checksum=True):
+        """Queue an atomic CSV write of df (see helper_functions.write_dataframe)"""
+        return self.submit(write_dataframe, df.copy(deep=False), filepath, index=index,
+                           checksum=checksum, nbytes=csv_buffer_bytes(df, index), label=filepath)
+
+    def flush(self):
+        """Wait for every queued export; re-raise the first failure"""
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.exception()
+        self._raise_first_error()
+
+    def close(self):
+        """Flush and shut down the pool"""
+        try:
+            self.flush()
+        finally:
+            self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Already failing: let queued writes finish, keep the original error
+            self._pool.shutdown(wait=True)
+        return False
@@ -0,0 +1,208 @@
+"""
+Heavy-hitter sketches for UIDAI Hackathon 2025
+Streaming top-N pincodes/centers during ingestion without a full grouping
+"""
+
+import heapq
+
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# KEY NORMALISATION
+# ============================================================================
+
+def canonical_keys(keys):
+    """
+    One string form per key, whatever dtype its shard was parsed with
+
+    A single missing value makes a shard's id column float, and hashing
+    110047 (int64) and 110047.0 (float64) gives different counters, so
+    integral numbers are written without a decimal part ('110047').
+    """
+    keys = pd.Series(np.asarray(keys))
+    numeric = pd.to_numeric(keys, errors='coerce')
+    integral = (numeric % 1 == 0).to_numpy()
+    result = keys.astype(str).to_numpy(dtype=object)
+    result[integral] = numeric[integral].astype(np.int64).astype(str).to_numpy()
+    return result
+
+# ============================================================================
+# SPACE-SAVING (top-k candidates with error bounds)
+# ============================================================================
+
+class SpaceSaving:
+    """
+    Weighted Space-Saving sketch tracking at most `capacity` keys
+
+    Any key whose true total exceeds (stream total / capacity) is
+    guaranteed to be tracked. Each reported count overestimates the true
+    total by at most its recorded error.
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+        self._heap = []  # (count, seq, key) entries; stale ones skipped lazily
+        self._seq = 0    # Tie-breaker so keys of mixed types are never compared
+
+    def _pop_min(self):
+        """Remove and return (count, key) of the smallest tracked counter"""
+        while True:
+            count, _, key = heapq.heappop(self._heap)
+            if self.counts.get(key) == count:
+                return count, key
+
+    def _push(self, key):
+        self._seq += 1
+        heapq.heappush(self._heap, (self.counts[key], self._seq, key))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, seq, k) for seq, (k, c) in enumerate(self.counts.items(), self._seq)]
+            self._seq += len(self._heap)
+            heapq.heapify(self._heap)
+
+    def update(self, key, weight=1):
+        """Add weight to key"""
+        self.total += weight
+        if key in self.counts:
+            self.counts[key] += weight
+        elif len(self.counts) < self.capacity:
+            self.counts[key] = weight
+            self.errors[key] = 0
+        else:
+            min_count, evicted = self._pop_min()
+            del self.counts[evicted]
+            del self.errors[evicted]
+            self.counts[key] = min_count + weight
+            self.errors[key] = min_count
+        self._push(key)
+
+    def update_many(self, keys, weights):
+        """
+        Add a batch of (key, weight) pairs
+
+        The batch is pre-summed per key first, so the sketch sees each key
+        at most once per batch.
+        """
+        batch = pd.Series(np.asarray(weights)).groupby(np.asarray(keys), sort=False).sum()
+        for key, weight in batch.items():
+            self.update(key, weight)
+
+    def top(self, n=15):
+        """
+        Return the n largest tracked keys
+
+        Returns:
+        --------
+        pandas.DataFrame
+            key, estimate (upper bound), error and guaranteed (lower bound)
+        """
+        leaders = heapq.nlargest(n, self.counts.items(), key=lambda item: item[1])
+        result = pd.DataFrame(leaders, columns=['key', 'estimate'])
+        result['error'] = [self.errors[key] for key in result['key']]
+        result['guaranteed'] = result['estimate'] - result['error']
+        return result
+
+# ============================================================================
+# COUNT-MIN (point estimates for any key)
+# ============================================================================
+
+class CountMinSketch:
+    """
+    Count-Min sketch with `depth` rows of `width` counters
+
+    Estimates never undercount; overcount is at most 2 * total / width
+    with probability 1 - 0.5 ** depth.
+    """
+
+    def __init__(self, width=2 ** 16, depth=4):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+        self._hash_keys = [f'countmin-row{row:04d}' for row in range(depth)]
+
+    def _columns(self, keys):
+        """Counter index of every key in every row (depth × len(keys))"""
+        values = np.asarray(keys)
+        return np.stack([pd.util.hash_array(values, hash_key=hash_key) % self.width
+                         for hash_key in self._hash_keys]).astype(np.int64)
+
+    def update_many(self, keys, weights):
+        """Add a batch of (key, weight) pairs"""
+        weights = np.asarray(weights, dtype=np.int64)
+        columns = self._columns(keys)
+        for row in range(self.depth):
+            np.add.at(self.table[row], columns[row], weights)
+        self.total += int(weights.sum())
+
+    def estimate(self, keys):
+        """Estimated totals for keys (array aligned with keys)"""
+        columns = self._columns(keys)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+# ============================================================================
+# INGESTION TRACKER
+# ============================================================================
+
+class HeavyHitterTracker:
+    """
+    Track the leading values of one column, weighted by a value column
+
+    Pass trackers to merge_csv_files (or call update per chunk) to report
+    top pincodes or centers while files are being ingested. Keys are
+    tracked in canonical string form (see canonical_keys).
+    """
+
+    def __init__(self, key_column, value_column, capacity=1000):
+        self.key_column = key_column
+        self.value_column = value_column
+        self.space_saving = SpaceSaving(capacity)
+        self.count_min = CountMinSketch()
+
+    def update(self, df):
+        """Add one chunk/shard of rows"""
+        if self.key_column not in df.columns or self.value_column not in df.columns:
+            return
+        rows = df[[self.key_column, self.value_column]].dropna()
+        keys = canonical_keys(rows[self.key_column])
+        weights = rows[self.value_column].to_numpy()
+        self.space_saving.update_many(keys, weights)
+        self.count_min.update_many(keys, weights)
+
+    def top(self, n=15):
+        """
+        Current leaders with Space-Saving bounds and Count-Min estimates
+
+        Every tracked candidate is tightened with its Count-Min estimate
+        before ranking, since Space-Saving estimates of light keys can be
+        inflated above a true heavy hitter.
+
+        Returns:
+        --------
+        pandas.DataFrame
+        """
+        result = self.space_saving.top(self.space_saving.capacity)
+        result = result.rename(columns={'key': self.key_column})
+        if len(result):
+            result['count_min_estimate'] = self.count_min.estimate(result[self.key_column].to_numpy())
+            # Both sketches only overcount, so the smaller upper bound is tighter
+            result['estimate'] = np.minimum(result['estimate'], result['count_min_estimate'])
+            result = result.sort_values('estimate', ascending=False, kind='stable')
+        result = result.head(n).reset_index(drop=True)
+        result['percentage'] = (result['estimate'] / self.space_saving.total * 100
+                                if self.space_saving.total else 0.0)
+        return result
+
+def print_heavy_hitters(trackers, n=15):
+    """Print the current leaders of each tracker"""
+    for tracker in trackers:
+        print(f"\nTop {n} by {tracker.key_column} (streaming estimate):")
+        print("=" * 50)
+        top = tracker.top(n)
+        for key, estimate, percentage in zip(top[tracker.key_column], top['estimate'],
+                                             top['percentage']):
+            print(f"  {key}: {estimate:,.0f} ({percentage:.2f}%)")
+        print("=" * 50)
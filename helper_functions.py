@@ -6,13 +6,38 @@ Reusable utility functions for data processing and analysis
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import csv
+import glob
+import gzip
+import hashlib
+import io
 import os
+import re
+import tempfile
+import zipfile
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; the pandas C parser is used instead
+    pa = None
+    pa_csv = None
+
+try:
+    import zstandard
+except ImportError:  # only needed for .zst shards
+    zstandard = None
+
+# Compressed shard extensions read by open_input_file
+COMPRESSED_EXTENSIONS = ('.gz', '.zst', '.zip')
 
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
 
-def load_csv_file(filepath, encoding='utf-8'):
+def load_csv_file(filepath, encoding='utf-8', quarantine_dir=None):
     """
     Load CSV file with error handling
     
@@ -22,44 +47,320 @@ def load_csv_file(filepath, encoding='utf-8'):
         Path to CSV file
     encoding : str
         File encoding (default: utf-8)
+    quarantine_dir : str
+        Directory for rejected rows (default: 'quarantine' next to the file)
     
     Returns:
     --------
     pandas.DataFrame or None
     """
-    try:
-        df = pd.read_csv(filepath, encoding=encoding)
-        print(f"✓ Loaded {filepath}: {len(df):,} records")
-        return df
-    except Exception as e:
-        print(f"✗ Error loading {filepath}: {e}")
-        return None
+    df, _ = load_csv_robust(filepath, encoding, quarantine_dir)
+    return df
+
+def open_input_file(filepath):
+    """
+    Open a raw shard as a binary stream, decompressing on the fly
+    
+    Supports plain files, .gz, .zst (needs the zstandard package) and .zip
+    archives holding a single CSV.
+    
+    Parameters:
+    -----------
+    filepath : str
+        Path to the shard
+    
+    Returns:
+    --------
+    binary file object
+    """
+    if filepath.endswith('.gz'):
+        return gzip.open(filepath, 'rb')
+    if filepath.endswith('.zst'):
+        if zstandard is None:
+            raise ImportError("Reading .zst files requires the zstandard package")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(filepath, 'rb'))
+        return io.BufferedReader(reader)
+    if filepath.endswith('.zip'):
+        archive = zipfile.ZipFile(filepath)
+        members = [m for m in archive.namelist() if not m.endswith('/')]
+        if len(members) != 1:
+            archive.close()
+            raise ValueError(f"Expected one file in {filepath}, found {len(members)}")
+        # The member stream keeps the archive open until it is closed itself
+        return archive.open(members[0])
+    return open(filepath, 'rb')
 
-def merge_csv_files(file_list, data_dir):
+def _natural_sort_key(path):
+    """Sort 'x_500000_1000000' before 'x_1000000_1500000'"""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', path)]
+
+def _shard_name(filename):
+    """Shard name without compression extension ('x.csv.gz' and 'x.zip' → 'x.csv')"""
+    for ext in COMPRESSED_EXTENSIONS:
+        if filename.endswith(ext):
+            filename = filename[:-len(ext)]
+            break
+    return filename if filename.endswith('.csv') else f"{filename}.csv"
+
+def resolve_input_files(file_list, data_dir):
+    """
+    Expand glob patterns in a list of input filenames
+    
+    Literal names are kept as-is; patterns (e.g. 'api_data_aadhar_*.csv')
+    are expanded. All files are returned in natural order of their shard
+    name. A shard present in several formats (e.g. x.csv, x.csv.gz and
+    x.zip) is only used once, taking the earliest entry in file_list.
+    
+    Parameters:
+    -----------
+    file_list : list
+        Filenames and/or glob patterns
+    data_dir : str
+        Directory containing the files
+    
+    Returns:
+    --------
+    list
+        Filenames relative to data_dir
+    """
+    chosen = {}
+    for entry in file_list:
+        if glob.has_magic(entry):
+            matches = sorted(os.path.relpath(path, data_dir)
+                             for path in glob.glob(os.path.join(data_dir, entry)))
+        else:
+            matches = [entry]
+        for filename in matches:
+            shard = _shard_name(filename)
+            if shard in chosen:
+                if chosen[shard] != filename:
+                    print(f"⚠ Skipping {filename}: same shard as {chosen[shard]}")
+                continue
+            chosen[shard] = filename
+
+    if not chosen:
+        print(f"⚠ No files match {', '.join(file_list)}")
+    return [chosen[shard] for shard in sorted(chosen, key=_natural_sort_key)]
+
+def _read_csv_pyarrow(filepath, encoding, bad_rows):
+    """Multi-threaded pyarrow parse; malformed rows are skipped into bad_rows"""
+    def on_invalid_row(row):
+        bad_rows.append((row.number, 'malformed row', row.text))
+        return 'skip'
+
+    with open_input_file(filepath) as f:
+        table = pa_csv.read_csv(
+            f,
+            read_options=pa_csv.ReadOptions(encoding=encoding, use_threads=True),
+            parse_options=pa_csv.ParseOptions(invalid_row_handler=on_invalid_row)
+        )
+    # Undecodable bytes make pyarrow type the column as binary instead of failing
+    undecodable = [field.name for field in table.schema
+                   if pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type)]
+    if undecodable:
+        raise ValueError(f"undecodable bytes in column(s) {', '.join(undecodable)}")
+    # Keep ISO dates as text, exactly like the pandas parser
+    for i, field in enumerate(table.schema):
+        if pa.types.is_date(field.type) or pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+    return table.to_pandas()
+
+def _short_rows(filepath, encoding, num_fields):
+    """Rows with fewer than num_fields fields (the C parser pads these with NaN)"""
+    with open_input_file(filepath) as f:
+        reader = csv.reader(io.TextIOWrapper(f, encoding=encoding, newline=''))
+        next(reader, None)
+        return [(reader.line_num, ','.join(row)) for row in reader if row and len(row) < num_fields]
+
+def _read_csv_recovering(filepath, encoding, bad_rows):
+    """
+    Line-by-line recovery parse for shards the fast parsers reject
+    
+    Lines that fail to decode or have more or fewer fields than the header
+    are moved to bad_rows; everything else is parsed. Assumes no quoted
+    newlines.
+    """
+    good_lines = []
+    num_fields = None
+    with open_input_file(filepath) as f:
+        for line_number, raw in enumerate(f, start=1):
+            try:
+                line = raw.decode(encoding)
+            except UnicodeDecodeError as e:
+                bad_rows.append((line_number, f'encoding error: {e.reason}',
+                                 raw.decode(encoding, errors='replace').rstrip('\r\n')))
+                continue
+            fields = next(csv.reader([line]), [])
+            if num_fields is None:
+                num_fields = len(fields)
+            elif fields and len(fields) != num_fields:
+                bad_rows.append((line_number, 'malformed row', line.rstrip('\r\n')))
+                continue
+            good_lines.append(line)
+
+    return pd.read_csv(io.StringIO(''.join(good_lines)))
+
+def _write_quarantine(filepath, bad_rows, quarantine_dir):
+    """Write rejected rows to <quarantine_dir>/<file>.rejected.tsv"""
+    quarantine_dir = quarantine_dir or os.path.join(os.path.dirname(os.path.abspath(filepath)),
+                                                    'quarantine')
+    os.makedirs(quarantine_dir, exist_ok=True)
+    quarantine_file = os.path.join(quarantine_dir, f"{os.path.basename(filepath)}.rejected.tsv")
+    with open(quarantine_file, 'w', encoding='utf-8') as f:
+        f.write("line\treason\trow\n")
+        for line_number, reason, text in bad_rows:
+            f.write(f"{'' if line_number is None else line_number}\t{reason}\t{text}\n")
+    return quarantine_file
+
+def load_csv_robust(filepath, encoding='utf-8', quarantine_dir=None, use_pyarrow=True):
+    """
+    Load CSV file with the fastest engine that can parse it
+    
+    Engines are tried in order: pyarrow (multi-threaded, if installed),
+    the pandas C parser, then a line-by-line recovery parse. Rows that
+    cannot be decoded or parsed are quarantined to a side file instead of
+    failing the whole shard. Compressed shards (.gz, .zst, .zip) are
+    decompressed as a stream.
+    
+    Parameters:
+    -----------
+    filepath : str
+        Path to CSV file (optionally compressed)
+    encoding : str
+        File encoding (default: utf-8)
+    quarantine_dir : str
+        Directory for rejected rows (default: 'quarantine' next to the file)
+    use_pyarrow : bool
+        Allow the pyarrow engine when available
+    
+    Returns:
+    --------
+    tuple
+        (pandas.DataFrame or None, report dict with file, engine, records,
+        bad_rows, quarantine_file and error)
+    """
+    report = {'file': filepath, 'engine': None, 'records': 0, 'bad_rows': 0,
+              'quarantine_file': None, 'error': None}
+    if not os.path.exists(filepath):
+        report['error'] = 'file not found'
+        print(f"✗ Error loading {filepath}: file not found")
+        return None, report
+
+    df = None
+    bad_rows = []
+
+    if use_pyarrow and pa_csv is not None:
+        try:
+            df = _read_csv_pyarrow(filepath, encoding, bad_rows)
+            report['engine'] = 'pyarrow'
+        except Exception as e:
+            print(f"⚠ pyarrow could not parse {filepath} ({e}); falling back")
+            bad_rows = []
+
+    if df is None:
+        try:
+            with open_input_file(filepath) as f:
+                df = pd.read_csv(f, encoding=encoding)
+            report['engine'] = 'c'
+            # Short rows come back NaN-padded; quarantine them like the other engines
+            if len(df.columns) and df.iloc[:, -1].isna().any() and \
+                    _short_rows(filepath, encoding, len(df.columns)):
+                print(f"⚠ C parser padded short rows in {filepath}; recovering line by line")
+                df = None
+        except (pd.errors.ParserError, UnicodeDecodeError) as e:
+            print(f"⚠ C parser could not parse {filepath} ({e}); recovering line by line")
+        except Exception as e:
+            report['error'] = str(e)
+            print(f"✗ Error loading {filepath}: {e}")
+            return None, report
+
+    if df is None:
+        try:
+            df = _read_csv_recovering(filepath, encoding, bad_rows)
+            report['engine'] = 'python-recovery'
+        except Exception as e:
+            report['error'] = str(e)
+            print(f"✗ Error loading {filepath}: {e}")
+            return None, report
+
+    report['records'] = len(df)
+    report['bad_rows'] = len(bad_rows)
+    print(f"✓ Loaded {filepath}: {len(df):,} records [{report['engine']}]")
+    if bad_rows:
+        report['quarantine_file'] = _write_quarantine(filepath, bad_rows, quarantine_dir)
+        print(f"⚠ Quarantined {len(bad_rows):,} bad rows → {report['quarantine_file']}")
+
+    return df, report
+
+def merge_csv_files(file_list, data_dir, trackers=None, quarantine_dir=None, workers=1,
+                    checkpoint_dir=None):
     """
     Merge multiple CSV files into single DataFrame
     
     Parameters:
     -----------
     file_list : list
-        List of CSV filenames
+        List of CSV filenames or glob patterns (plain or .gz/.zst/.zip)
     data_dir : str
         Directory containing CSV files
+    trackers : list
+        Optional heavy-hitter trackers updated with each loaded file
+    quarantine_dir : str
+        Directory for rows rejected while loading
+    workers : int
+        Processes used to decompress and parse files (1 = serial)
+    checkpoint_dir : str
+        Save each parsed file here and reuse it on the next run, so an
+        interrupted merge resumes after the last completed file
     
     Returns:
     --------
     pandas.DataFrame
     """
+    filepaths = [os.path.join(data_dir, filename)
+                 for filename in resolve_input_files(file_list, data_dir)]
+    
+    resumed = {}
+    if checkpoint_dir:
+        from utils.checkpoint import load_shard_checkpoint, save_shard_checkpoint
+        for filepath in filepaths:
+            df = load_shard_checkpoint(checkpoint_dir, filepath)
+            if df is not None:
+                resumed[filepath] = df
+                print(f"✓ Resumed {filepath} from checkpoint: {len(df):,} records")
+    pending = [filepath for filepath in filepaths if filepath not in resumed]
+    
+    if workers and workers > 1 and len(pending) > 1:
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(pending)))
+        results = pool.map(load_csv_robust, pending, ['utf-8'] * len(pending),
+                           [quarantine_dir] * len(pending))
+    else:
+        pool = None
+        results = (load_csv_robust(filepath, quarantine_dir=quarantine_dir)
+                   for filepath in pending)
+    
     dfs = []
-    for filename in file_list:
-        filepath = os.path.join(data_dir, filename)
-        df = load_csv_file(filepath)
+    quarantined = 0
+    for filepath in filepaths:
+        if filepath in resumed:
+            df = resumed[filepath]
+        else:
+            df, report = next(results)
+            quarantined += report['bad_rows']
+            if df is not None and checkpoint_dir:
+                save_shard_checkpoint(checkpoint_dir, filepath, df)
         if df is not None:
+            for tracker in trackers or []:
+                tracker.update(df)
             dfs.append(df)
+    if pool is not None:
+        pool.shutdown()
     
     if dfs:
         merged_df = pd.concat(dfs, ignore_index=True)
         print(f"\n✓ Total records after merge: {len(merged_df):,}")
+        if quarantined:
+            print(f"⚠ Total rows quarantined: {quarantined:,}")
         return merged_df
     else:
         print("✗ No data files loaded successfully")
@@ -352,11 +653,103 @@ def detect_outliers_iqr(df, column, multiplier=1.5):
     
     return outliers
 
+def batch_distribution_statistics(df, group_columns, value_column,
+                                  percentiles=(0.25, 0.50, 0.75, 0.95, 0.99)):
+    """
+    Distribution statistics for every group in one pass
+    
+    Values are sorted once by (group, value); each group's quantiles are
+    then read from its slice of the sorted array using offset arithmetic
+    (linear interpolation, same as pandas quantile). Counts, sums, means
+    and standard deviations come from bincount. Rows with a missing group
+    key form their own group.
+    
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+    group_columns : str or list
+        Column(s) defining the groups (e.g. ['state', 'age_category'])
+    value_column : str
+        Column to analyze
+    percentiles : list
+        Quantiles to report (default: 25/50/75/95/99th)
+    
+    Returns:
+    --------
+    pandas.DataFrame
+        One row per group: count, sum, mean, std, min, q25.., max
+    """
+    if isinstance(group_columns, str):
+        group_columns = [group_columns]
+    
+    data = df[group_columns + [value_column]].dropna(subset=[value_column])
+    grouped = data.groupby(group_columns, observed=True, sort=True, dropna=False)
+    codes = grouped.ngroup().to_numpy()
+    result = grouped.size().index.to_frame(index=False)
+    values = data[value_column].to_numpy(dtype=float)
+    
+    # Sort by value, then stable-sort by group (radix sort for small codes)
+    order = np.argsort(values)
+    group_codes = codes[order].astype(np.int16 if len(result) < 2 ** 15 else np.int64)
+    order = order[np.argsort(group_codes, kind='stable')]
+    sorted_values = values[order]
+    counts = np.bincount(codes, minlength=len(result))
+    starts = np.cumsum(counts) - counts
+    ends = starts + counts - 1
+    
+    sums = np.bincount(codes, weights=values, minlength=len(result))
+    means = sums / counts
+    squared_dev = np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=len(result))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        stds = np.sqrt(squared_dev / (counts - 1))
+    
+    result['count'] = counts
+    result['sum'] = sums
+    result['mean'] = means
+    result['std'] = np.where(counts > 1, stds, np.nan)
+    result['min'] = sorted_values[starts]
+    for q in percentiles:
+        position = starts + q * (counts - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, ends)
+        fraction = position - lower
+        result[f'q{q * 100:g}'] = (sorted_values[lower] +
+                                   (sorted_values[upper] - sorted_values[lower]) * fraction)
+    result['max'] = sorted_values[ends]
+    
+    return result
+
+def comparative_distribution_statistics(datasets, group_columns,
+                                        percentiles=(0.25, 0.50, 0.75, 0.95, 0.99)):
+    """
+    Batched distribution statistics for several systems in one table
+    
+    Parameters:
+    -----------
+    datasets : dict
+        System name -> (DataFrame, value column)
+    group_columns : str or list
+        Column(s) present in every DataFrame
+    percentiles : list
+        Quantiles to report
+    
+    Returns:
+    --------
+    pandas.DataFrame
+        Tidy table with a leading 'system' column
+    """
+    tables = []
+    for system, (df, value_column) in datasets.items():
+        stats = batch_distribution_statistics(df, group_columns, value_column, percentiles)
+        stats.insert(0, 'system', system)
+        tables.append(stats)
+    return pd.concat(tables, ignore_index=True)
+
 # ============================================================================
 # AGGREGATION FUNCTIONS
 # ============================================================================
 
-def aggregate_by_state(df, value_column):
+def aggregate_by_state(df, value_column, top_n=None):
     """
     Aggregate data by state
     
@@ -365,26 +758,29 @@ def aggregate_by_state(df, value_column):
     df : pandas.DataFrame
     value_column : str
         Column to aggregate
+    top_n : int
+        Return only the N largest states (partial selection, no full sort)
     
     Returns:
     --------
     pandas.DataFrame
         State-level aggregated data
     """
-    state_agg = df.groupby('state').agg({
+    state_agg = df.groupby('state', observed=True).agg({
         value_column: ['sum', 'mean', 'count']
     }).reset_index()
     
     state_agg.columns = ['state', f'total_{value_column}', f'avg_{value_column}', 'num_records']
-    state_agg = state_agg.sort_values(f'total_{value_column}', ascending=False)
     
     # Calculate percentage
     state_agg['percentage'] = (state_agg[f'total_{value_column}'] / 
                                state_agg[f'total_{value_column}'].sum() * 100)
     
-    return state_agg
+    if top_n is not None:
+        return state_agg.nlargest(top_n, f'total_{value_column}')
+    return state_agg.sort_values(f'total_{value_column}', ascending=False)
 
-def aggregate_by_district(df, value_column):
+def aggregate_by_district(df, value_column, top_n=None):
     """
     Aggregate data by district
     
@@ -393,20 +789,23 @@ def aggregate_by_district(df, value_column):
     df : pandas.DataFrame
     value_column : str
         Column to aggregate
+    top_n : int
+        Return only the N largest districts (partial selection, no full sort)
     
     Returns:
     --------
     pandas.DataFrame
         District-level aggregated data
     """
-    district_agg = df.groupby(['state', 'district']).agg({
+    district_agg = df.groupby(['state', 'district'], observed=True).agg({
         value_column: 'sum'
     }).reset_index()
     
     district_agg.columns = ['state', 'district', f'total_{value_column}']
-    district_agg = district_agg.sort_values(f'total_{value_column}', ascending=False)
     
-    return district_agg
+    if top_n is not None:
+        return district_agg.nlargest(top_n, f'total_{value_column}')
+    return district_agg.sort_values(f'total_{value_column}', ascending=False)
 
 def aggregate_by_date(df, date_column, value_column):
     """
@@ -425,7 +824,7 @@ def aggregate_by_date(df, date_column, value_column):
     pandas.DataFrame
         Date-level aggregated data
     """
-    date_agg = df.groupby(date_column).agg({
+    date_agg = df.groupby(date_column, observed=True).agg({
         value_column: 'sum'
     }).reset_index()
     
@@ -433,13 +832,109 @@ def aggregate_by_date(df, date_column, value_column):
     
     return date_agg
 
+def top_n_groups(df, group_columns, value_column, n=15):
+    """
+    Top N groups by total value using partial selection
+    
+    Groups are summed without sorting and the leaders picked with
+    nlargest, so only the N returned rows are ordered.
+    
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+    group_columns : str or list
+        Column(s) to group by (e.g. 'pincode', ['state', 'district'])
+    value_column : str
+        Column to aggregate
+    n : int
+        Number of groups to return
+    
+    Returns:
+    --------
+    pandas.DataFrame
+        N largest groups with total and percentage of the overall total
+    """
+    totals = df.groupby(group_columns, observed=True, sort=False)[value_column].sum()
+    top = totals.nlargest(n).reset_index()
+    top.columns = list(top.columns[:-1]) + [f'total_{value_column}']
+    top['percentage'] = top[f'total_{value_column}'] / totals.sum() * 100
+    return top.reset_index(drop=True)
+
 # ============================================================================
 # EXPORT FUNCTIONS
 # ============================================================================
 
-def save_dataframe(df, filepath, index=False):
+def file_checksum(filepath, chunk_size=1 << 20):
+    """SHA-256 hex digest of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def checksum_path(filepath):
+    """Path of the checksum sidecar for a file"""
+    return f"{filepath}.sha256"
+
+@contextmanager
+def atomic_write_path(filepath):
+    """
+    Yield a temporary path that replaces filepath only on success
+    
+    The temporary file sits in the same directory (keeping any extension,
+    so compression inference still works), is fsynced and then renamed
+    over filepath. On error it is removed and filepath is left untouched.
+    """
+    directory, filename = os.path.split(os.path.abspath(filepath))
+    tmp_path = os.path.join(directory, f".tmp-{os.getpid()}-{filename}")
+    try:
+        yield tmp_path
+        with open(tmp_path, 'rb+') as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_checksum(filepath):
+    """
+    Write a sha256sum-compatible sidecar (<file>.sha256) for filepath
+    
+    Returns:
+    --------
+    str
+        Hex digest
+    """
+    digest = file_checksum(filepath)
+    with atomic_write_path(checksum_path(filepath)) as tmp_path:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(f"{digest}  {os.path.basename(filepath)}\n")
+    return digest
+
+def verify_checksum(filepath):
     """
-    Save DataFrame to CSV with confirmation
+    Check a file against its checksum sidecar
+    
+    Returns:
+    --------
+    bool or None
+        True/False, or None if the file or sidecar is missing
+    """
+    sidecar = checksum_path(filepath)
+    if not os.path.exists(filepath) or not os.path.exists(sidecar):
+        return None
+    with open(sidecar, 'r', encoding='utf-8') as f:
+        expected = f.read().split()[0]
+    return file_checksum(filepath) == expected
+
+def write_dataframe(df, filepath, index=False, checksum=True):
+    """
+    Write DataFrame to CSV, raising on failure
+    
+    The file is written atomically (temp file + rename), so a crash never
+    leaves a truncated output behind, and a .sha256 sidecar is written
+    next to it.
     
     Parameters:
     -----------
@@ -448,12 +943,30 @@ def save_dataframe(df, filepath, index=False):
         Output file path
     index : bool
         Include index in output
+    checksum : bool
+        Write a checksum sidecar
+    """
+    with atomic_write_path(filepath) as tmp_path:
+        df.to_csv(tmp_path, index=index)
+    if checksum:
+        write_checksum(filepath)
+    print(f"✓ Saved: {filepath} ({len(df):,} records)")
+
+def save_dataframe(df, filepath, index=False, checksum=True):
+    """
+    Save DataFrame to CSV with confirmation (see write_dataframe)
+    
+    Returns:
+    --------
+    bool
+        True if the file was saved
     """
     try:
-        df.to_csv(filepath, index=index)
-        print(f"✓ Saved: {filepath} ({len(df):,} records)")
+        write_dataframe(df, filepath, index=index, checksum=checksum)
+        return True
     except Exception as e:
         print(f"✗ Error saving {filepath}: {e}")
+        return False
 
 def print_dataframe_info(df, name="DataFrame"):
     """
@@ -529,6 +1042,39 @@ def test_helper_functions():
     state_agg = aggregate_by_state(df, 'value')
     print(f"\nState Aggregation:\n{state_agg.head()}")
     
+    print("\n6. Testing robust CSV loading (bad byte, short row)...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        rows = b"Uttar Pradesh,Lucknow,1\n" * 1000
+        shards = {'bad_byte.csv': (b"Bih\xffar,Patna,2\n" + b"Bihar,Patna\n", 2),
+                  'short_row.csv': (b"Bihar,Patna\n", 1)}
+        for name, (bad_lines, num_bad) in shards.items():
+            shard = os.path.join(tmp_dir, name)
+            with open(shard, 'wb') as f:
+                f.write(b"state,district,value\n" + rows + bad_lines + rows)
+            for use_pyarrow in ([True, False] if pa_csv is not None else [False]):
+                loaded, report = load_csv_robust(shard, quarantine_dir=tmp_dir,
+                                                 use_pyarrow=use_pyarrow)
+                assert report['records'] == 2000 and report['bad_rows'] == num_bad, report
+                assert (loaded['state'] == 'Uttar Pradesh').all()
+                assert loaded['value'].dtype.kind == 'i'
+    
+    print("\n7. Testing batched distribution statistics against pandas...")
+    sample = df[['state', 'age_category']].copy()
+    sample['value'] = np.random.default_rng(0).normal(50, 20, len(sample))
+    sample.loc[0, 'state'] = None
+    sample.loc[1, 'value'] = np.nan
+    percentiles = [0.25, 0.5, 0.95]
+    batched = batch_distribution_statistics(sample, ['state', 'age_category'], 'value',
+                                            percentiles).set_index(['state', 'age_category'])
+    expected = sample.groupby(['state', 'age_category'], dropna=False)['value']
+    assert len(batched) == expected.ngroups
+    pd.testing.assert_series_equal(batched['count'], expected.count(), check_names=False,
+                                   check_dtype=False)
+    pd.testing.assert_series_equal(batched['std'], expected.std(), check_names=False)
+    for q in percentiles:
+        pd.testing.assert_series_equal(batched[f'q{q * 100:g}'], expected.quantile(q),
+                                       check_names=False)
+    
     print("\n" + "=" * 80)
     print("ALL TESTS COMPLETED SUCCESSFULLY!")
     print("=" * 80)
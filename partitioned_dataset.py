@@ -0,0 +1,207 @@
+"""
+Partitioned dataset layout for UIDAI Hackathon 2025
+Processed data written as system=.../state=.../month=... with a metadata
+index per system, and readers that only open partitions matching the filters
+"""
+
+import glob
+import os
+import shutil
+from urllib.parse import quote
+
+import pandas as pd
+
+INDEX_FILENAME = '_partition_index.csv'
+INDEX_COLUMNS = ['system', 'state', 'month', 'path', 'rows', 'min_date', 'max_date']
+NULL_PARTITION = '__null__'
+
+# ============================================================================
+# PARTITION INDEX
+# ============================================================================
+
+def load_partition_index(root):
+    """
+    Load the partition index (one row per partition)
+
+    Each system keeps its own index inside its directory, so merges of
+    different systems never rewrite each other's entries; they are
+    combined here.
+
+    Returns:
+    --------
+    pandas.DataFrame
+        system, state, month, path, rows, min_date, max_date
+    """
+    index_paths = sorted(glob.glob(os.path.join(glob.escape(root), 'system=*', INDEX_FILENAME)))
+    if not index_paths:
+        return pd.DataFrame(columns=INDEX_COLUMNS)
+    return pd.concat([pd.read_csv(path, parse_dates=['min_date', 'max_date'],
+                                  dtype={'state': str, 'month': str}, keep_default_na=False)
+                      for path in index_paths], ignore_index=True)
+
+def _save_partition_index(index, directory):
+    """Write a system's partition index into its (not yet published) directory"""
+    out = index.copy()
+    out['min_date'] = pd.to_datetime(out['min_date']).dt.strftime('%Y-%m-%d')
+    out['max_date'] = pd.to_datetime(out['max_date']).dt.strftime('%Y-%m-%d')
+    out.to_csv(os.path.join(directory, INDEX_FILENAME), index=False)
+
+# ============================================================================
+# WRITING
+# ============================================================================
+
+def _partition_dir(system, state, month):
+    """Relative directory for one partition"""
+    state_key = NULL_PARTITION if pd.isna(state) else quote(str(state), safe='')
+    return os.path.join(f"system={system}", f"state={state_key}", f"month={month}")
+
+def write_partitioned_dataset(df, root, system, date_column):
+    """
+    Write a system's processed data partitioned by state and month
+
+    Replaces any previous partitions of the same system. The system's
+    index is written with its partitions and published by the same
+    directory rename.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Processed system data
+    root : str
+        Dataset root directory
+    system : str
+        'enrollment', 'biometric' or 'demographic'
+    date_column : str
+        Date column used for the month partition and min/max dates
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Index rows for the written partitions
+    """
+    dates = pd.to_datetime(df[date_column])
+    months = dates.dt.strftime('%Y-%m').fillna(NULL_PARTITION)
+
+    system_dir = os.path.join(root, f"system={system}")
+    tmp_dir = os.path.join(root, f".tmp-system={system}-{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    entries = []
+    grouped = df.groupby([df['state'], months], observed=True, sort=True, dropna=False)
+    for (state, month), positions in grouped.indices.items():
+        part = df.iloc[positions]
+        part_dates = dates.iloc[positions]
+        rel_dir = _partition_dir(system, state, month)
+        out_dir = os.path.join(tmp_dir, os.path.relpath(rel_dir, f"system={system}"))
+        os.makedirs(out_dir, exist_ok=True)
+        part.to_csv(os.path.join(out_dir, 'part-0.csv'), index=False)
+        entries.append({
+            'system': system,
+            'state': NULL_PARTITION if pd.isna(state) else state,
+            'month': month,
+            'path': os.path.join(rel_dir, 'part-0.csv'),
+            'rows': len(part),
+            'min_date': part_dates.min(),
+            'max_date': part_dates.max()
+        })
+
+    written = pd.DataFrame(entries, columns=INDEX_COLUMNS)
+    os.makedirs(tmp_dir, exist_ok=True)
+    _save_partition_index(written, tmp_dir)
+
+    shutil.rmtree(system_dir, ignore_errors=True)
+    os.rename(tmp_dir, system_dir)
+
+    print(f"✓ Wrote {len(written):,} {system} partitions to {system_dir} "
+          f"({written['rows'].sum():,} records)")
+    return written
+
+# ============================================================================
+# READING (with partition pruning)
+# ============================================================================
+
+def list_partitions(root, system, states=None, start_date=None, end_date=None):
+    """
+    Partitions of a system that can contain rows matching the filters
+
+    Parameters:
+    -----------
+    root : str
+        Dataset root directory
+    system : str
+        System name
+    states : str or list
+        State name(s) to keep
+    start_date, end_date : str or datetime
+        Inclusive date range; partitions are pruned on their min/max dates
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Matching rows of the partition index
+    """
+    index = load_partition_index(root)
+    keep = index['system'] == system
+
+    if states is not None:
+        if isinstance(states, str):
+            states = [states]
+        keep &= index['state'].isin(states)
+    if start_date is not None:
+        keep &= index['max_date'] >= pd.Timestamp(start_date)
+    if end_date is not None:
+        keep &= index['min_date'] <= pd.Timestamp(end_date)
+
+    return index[keep].reset_index(drop=True)
+
+def read_partitioned_dataset(root, system, date_column, states=None, start_date=None,
+                             end_date=None, columns=None):
+    """
+    Read only the partitions needed for a state/date-scoped analysis
+
+    Parameters:
+    -----------
+    root : str
+        Dataset root directory
+    system : str
+        System name
+    date_column : str
+        Date column used for exact row-level date filtering
+    states : str or list
+        State name(s) to keep
+    start_date, end_date : str or datetime
+        Inclusive date range
+    columns : list
+        Columns to load (default: all)
+
+    Returns:
+    --------
+    pandas.DataFrame or None
+    """
+    partitions = list_partitions(root, system, states, start_date, end_date)
+    total = int((load_partition_index(root)['system'] == system).sum())
+    if partitions.empty:
+        print(f"✗ No {system} partitions match the filters")
+        return None
+
+    usecols = None
+    if columns is not None:
+        usecols = list(dict.fromkeys(list(columns) + [date_column]))
+
+    df = pd.concat([pd.read_csv(os.path.join(root, path), usecols=usecols)
+                    for path in partitions['path']], ignore_index=True)
+
+    if start_date is not None or end_date is not None:
+        dates = pd.to_datetime(df[date_column])
+        mask = pd.Series(True, index=df.index)
+        if start_date is not None:
+            mask &= dates >= pd.Timestamp(start_date)
+        if end_date is not None:
+            mask &= dates <= pd.Timestamp(end_date)
+        df = df[mask].reset_index(drop=True)
+
+    if columns is not None:
+        df = df[list(columns)]
+
+    print(f"✓ Read {len(partitions):,} of {total:,} {system} partitions: {len(df):,} records")
+    return df
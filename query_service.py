@@ -0,0 +1,227 @@
+"""
+Local query service for UIDAI Hackathon 2025
+Serves rollups from the aggregate cubes over HTTP with an LRU response cache
+"""
+
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qsl
+
+import numpy as np
+import pandas as pd
+
+from utils.aggregate_cube import CUBE_DIMENSIONS, rollup_cube
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+class ResponseCache:
+    """Thread-safe LRU cache of (etag, body) pairs keyed by normalised query"""
+
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {'size': len(self._entries), 'max_size': self.max_size,
+                    'hits': self.hits, 'misses': self.misses}
+
+# ============================================================================
+# QUERY EXECUTION
+# ============================================================================
+
+def _json_default(value):
+    """Convert numpy/pandas scalars for json.dumps"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d')
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+def run_rollup_query(cubes, params):
+    """
+    Execute a rollup query against the loaded cubes
+
+    Parameters:
+    -----------
+    cubes : dict
+        System name to aggregate cube
+    params : dict
+        Query parameters: system, by, start, end, top and any cube
+        dimension as a filter (comma separated for several values)
+
+    Returns:
+    --------
+    dict
+        JSON-serialisable response payload
+    """
+    system = params.get('system')
+    if system not in cubes:
+        raise ValueError(f"Unknown system: {system!r} (available: {', '.join(cubes)})")
+
+    by = [dim for dim in params.get('by', '').split(',') if dim]
+    filters = {dim: params[dim].split(',') for dim in CUBE_DIMENSIONS
+               if dim != 'date' and params.get(dim)}
+    top_n = int(params['top']) if params.get('top') else None
+
+    result = rollup_cube(cubes[system], by=by, filters=filters,
+                         start_date=params.get('start'), end_date=params.get('end'),
+                         top_n=top_n)
+    if 'date' in result.columns:
+        result['date'] = result['date'].dt.strftime('%Y-%m-%d')
+    # Missing keys are kept by the rollup; send them as null (NaN is not valid JSON)
+    result[by] = result[by].astype(object).where(result[by].notna(), None)
+
+    return {
+        'system': system,
+        'by': by,
+        'filters': filters,
+        'start': params.get('start'),
+        'end': params.get('end'),
+        'total': result['total'].sum(),
+        'rows': result.to_dict(orient='records')
+    }
+
+def describe_cubes(cubes):
+    """Summarise loaded cubes for the /systems endpoint"""
+    return {
+        'dimensions': CUBE_DIMENSIONS,
+        'systems': {
+            system: {
+                'cells': len(cube),
+                'total': cube['total'].sum(),
+                'start': cube['date'].min(),
+                'end': cube['date'].max()
+            }
+            for system, cube in cubes.items()
+        }
+    }
+
+# ============================================================================
+# HTTP SERVER
+# ============================================================================
+
+def make_handler(cubes, cache, allowed_origin=None):
+    """
+    Create a request handler class bound to the given cubes and cache
+
+    Only allowed_origin (the dashboard) gets a CORS header, so other web
+    pages open in the same browser cannot read the aggregates.
+
+    Endpoints:
+        GET /health   - liveness and cache statistics
+        GET /systems  - loaded systems, cell counts and date ranges
+        GET /rollup   - rollup query, e.g.
+                        /rollup?system=enrollment&by=state&top=15
+                        /rollup?system=biometric&by=date&state=Maharashtra
+    """
+
+    class QueryHandler(BaseHTTPRequestHandler):
+
+        def _send(self, status, body=b'', etag=None):
+            self.send_response(status)
+            if allowed_origin and self.headers.get('Origin') == allowed_origin:
+                self.send_header('Access-Control-Allow-Origin', allowed_origin)
+            self.send_header('Vary', 'Origin')
+            self.send_header('Cache-Control', 'no-cache')
+            if etag:
+                self.send_header('ETag', etag)
+            if body:
+                self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+        def _send_json(self, status, payload):
+            self._send(status, json.dumps(payload, default=_json_default).encode('utf-8'))
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = dict(parse_qsl(url.query))
+
+            if url.path == '/health':
+                self._send_json(200, {'status': 'ok', 'cache': cache.stats()})
+                return
+            if url.path == '/systems':
+                self._send_json(200, describe_cubes(cubes))
+                return
+            if url.path != '/rollup':
+                self._send_json(404, {'error': f"Unknown endpoint: {url.path}"})
+                return
+
+            key = tuple(sorted(params.items()))
+            entry = cache.get(key)
+            if entry is None:
+                try:
+                    payload = run_rollup_query(cubes, params)
+                except ValueError as e:
+                    self._send_json(400, {'error': str(e)})
+                    return
+                body = json.dumps(payload, default=_json_default).encode('utf-8')
+                entry = (f'"{hashlib.sha1(body).hexdigest()}"', body)
+                cache.put(key, entry)
+
+            etag, body = entry
+            if self.headers.get('If-None-Match') == etag:
+                self._send(304, etag=etag)
+            else:
+                self._send(200, body, etag=etag)
+
+        def log_message(self, format, *args):
+            pass
+
+    return QueryHandler
+
+def run_query_service(cubes, host='127.0.0.1', port=8765, cache_size=512, allowed_origin=None):
+    """
+    Serve rollup queries until interrupted
+
+    Parameters:
+    -----------
+    cubes : dict
+        System name to aggregate cube
+    host : str
+        Bind address (keep on localhost)
+    port : int
+        Port to listen on
+    cache_size : int
+        Maximum cached responses
+    allowed_origin : str
+        Dashboard origin allowed to read responses cross-origin (CORS)
+    """
+    cache = ResponseCache(cache_size)
+    server = ThreadingHTTPServer((host, port), make_handler(cubes, cache, allowed_origin))
+    print(f"✓ Query service listening on http://{host}:{port} "
+          f"({', '.join(cubes)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✓ Query service stopped")
+    finally:
+        server.server_close()
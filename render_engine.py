@@ -0,0 +1,232 @@
+"""
+Rendering engine for UIDAI Hackathon 2025
+Parallel, cached chart rendering from precomputed aggregates
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+# ============================================================================
+# CHART SPECIFICATIONS
+# ============================================================================
+
+def chart_spec(name, render_func, data, **options):
+    """
+    Describe one chart to render
+
+    Parameters:
+    -----------
+    name : str
+        Chart name, also the output filename stem
+    render_func : callable
+        Module-level function render_func(data, style, **options) returning
+        a matplotlib Figure (must be picklable for the process pool)
+    data : pandas.DataFrame
+        Precomputed aggregate the chart plots
+    **options
+        Extra keyword arguments for render_func (title, columns, ...)
+
+    Returns:
+    --------
+    dict
+    """
+    return {'name': name, 'render': render_func, 'data': data, 'options': options}
+
+def compute_chart_hash(spec, style):
+    """
+    Hash everything that determines a chart's pixels
+
+    Covers the render function, the aggregate data (values, index, columns
+    and dtypes), the chart options and the style config.
+
+    Returns:
+    --------
+    str
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    func = spec['render']
+    digest.update(f"{func.__module__}.{func.__qualname__}".encode('utf-8'))
+
+    data = spec['data']
+    digest.update(json.dumps([[str(c), str(t)] for c, t in data.dtypes.items()]).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+
+    digest.update(json.dumps(spec['options'], sort_keys=True, default=str).encode('utf-8'))
+    digest.update(json.dumps(style, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+# ============================================================================
+# RENDER MANIFEST
+# ============================================================================
+
+def load_render_manifest(filepath):
+    """Load chart name -> hash manifest (empty if missing or unreadable)"""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_render_manifest(manifest, filepath):
+    """Save chart name -> hash manifest"""
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, filepath)
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+def _render_chart(spec, style, output_path, dpi):
+    """Render one chart to disk (runs inside a worker process)"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    plt.rcParams['font.family'] = style.get('font_family', 'sans-serif')
+    plt.rcParams['xtick.labelsize'] = style.get('font_size_tick', 10)
+    plt.rcParams['ytick.labelsize'] = style.get('font_size_tick', 10)
+
+    fig = spec['render'](spec['data'], style, **spec['options'])
+    try:
+        fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return output_path
+
+def render_charts(specs, style, output_dir, manifest_path=None, workers=None,
+                  preview=False, preview_dpi=72, force=False):
+    """
+    Render charts in a process pool, skipping unchanged ones
+
+    A chart is skipped when its PNG exists and its hash (data + options +
+    style) matches the manifest. Preview mode renders every chart at
+    preview_dpi into output_dir/preview and leaves the manifest untouched.
+
+    Parameters:
+    -----------
+    specs : list
+        Chart specs from chart_spec
+    style : dict
+        Style config (see config.get_style_config)
+    output_dir : str
+        Directory for PNG files
+    manifest_path : str
+        Manifest file path (default: output_dir/render_manifest.json)
+    workers : int
+        Process pool size (default: CPU count)
+    preview : bool
+        Fast low-DPI preview mode
+    preview_dpi : int
+        DPI used in preview mode
+    force : bool
+        Re-render every chart regardless of the manifest
+
+    Returns:
+    --------
+    dict
+        Lists of 'rendered' and 'skipped' chart names and a 'failed'
+        dict of chart name -> error message
+    """
+    if preview:
+        output_dir = os.path.join(output_dir, 'preview')
+        dpi = preview_dpi
+    else:
+        dpi = style.get('dpi', 300)
+    os.makedirs(output_dir, exist_ok=True)
+
+    manifest_path = manifest_path or os.path.join(output_dir, 'render_manifest.json')
+    manifest = {} if preview else load_render_manifest(manifest_path)
+
+    summary = {'rendered': [], 'skipped': [], 'failed': {}}
+    pending = []
+    for spec in specs:
+        output_path = os.path.join(output_dir, f"{spec['name']}.png")
+        chart_hash = compute_chart_hash(spec, style)
+        if (not preview and not force and manifest.get(spec['name']) == chart_hash
+                and os.path.exists(output_path)):
+            summary['skipped'].append(spec['name'])
+        else:
+            pending.append((spec, output_path, chart_hash))
+
+    print(f"\nRendering {len(pending)} of {len(specs)} charts at {dpi} DPI "
+          f"({len(summary['skipped'])} unchanged)")
+
+    def record(spec, chart_hash, error=None):
+        if error is None:
+            summary['rendered'].append(spec['name'])
+            if not preview:
+                manifest[spec['name']] = chart_hash
+            print(f"✓ Rendered: {spec['name']}")
+        else:
+            summary['failed'][spec['name']] = str(error)
+            manifest.pop(spec['name'], None)
+            print(f"✗ Error rendering {spec['name']}: {error}")
+
+    if len(pending) <= 1 or workers == 1:
+        for spec, output_path, chart_hash in pending:
+            try:
+                _render_chart(spec, style, output_path, dpi)
+                record(spec, chart_hash)
+            except Exception as e:
+                record(spec, chart_hash, e)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_render_chart, spec, style, output_path, dpi): (spec, chart_hash)
+                       for spec, output_path, chart_hash in pending}
+            for future in as_completed(futures):
+                spec, chart_hash = futures[future]
+                try:
+                    future.result()
+                    record(spec, chart_hash)
+                except Exception as e:
+                    record(spec, chart_hash, e)
+
+    if not preview:
+        save_render_manifest(manifest, manifest_path)
+
+    return summary
+
+# ============================================================================
+# STANDARD CHART TYPES
+# ============================================================================
+
+def render_bar_chart(data, style, label_column, value_column, title,
+                     size='medium', color='primary', horizontal=True):
+    """Bar chart of value_column by label_column (largest first)"""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=style[f'figure_size_{size}'])
+    labels = data[label_column].astype(str)
+    if horizontal:
+        ax.barh(labels[::-1], data[value_column][::-1], color=style['colors'][color])
+        ax.set_xlabel(value_column.replace('_', ' ').title(), fontsize=style['font_size_label'])
+    else:
+        ax.bar(labels, data[value_column], color=style['colors'][color])
+        ax.set_ylabel(value_column.replace('_', ' ').title(), fontsize=style['font_size_label'])
+        ax.tick_params(axis='x', rotation=45)
+    ax.set_title(title, fontsize=style['font_size_title'], fontweight='bold')
+    ax.grid(axis='x' if horizontal else 'y', alpha=0.3)
+    fig.tight_layout()
+    return fig
+
+def render_line_chart(data, style, x_column, value_column, title,
+                      size='large', color='secondary'):
+    """Line chart of value_column over x_column (e.g. daily totals)"""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=style[f'figure_size_{size}'])
+    ax.plot(data[x_column], data[value_column], color=style['colors'][color], linewidth=1.5)
+    ax.set_xlabel(x_column.replace('_', ' ').title(), fontsize=style['font_size_label'])
+    ax.set_ylabel(value_column.replace('_', ' ').title(), fontsize=style['font_size_label'])
+    ax.set_title(title, fontsize=style['font_size_title'], fontweight='bold')
+    ax.grid(alpha=0.3)
+    fig.autofmt_xdate()
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,212 @@
+"""
+Time-series engine for UIDAI Hackathon 2025
+Dense daily series per system/state/district with vectorised rolling
+statistics, week-over-week change, day-of-week seasonality and spikes
+"""
+
+import numpy as np
+import pandas as pd
+
+# Series keys for each panel level
+PANEL_LEVELS = {
+    'national': [],
+    'state': ['state'],
+    'district': ['state', 'district'],
+    'pincode': ['state', 'district', 'pincode']
+}
+
+# ============================================================================
+# PANEL CONSTRUCTION
+# ============================================================================
+
+def build_daily_panel(cube, level='state', start_date=None, end_date=None):
+    """
+    Build a dense, gap-filled daily panel from an aggregate cube
+
+    Parameters:
+    -----------
+    cube : pandas.DataFrame
+        Aggregate cube (see aggregate_cube.build_aggregate_cube)
+    level : str
+        'national', 'state', 'district' or 'pincode'
+    start_date, end_date : str or datetime
+        Panel date range (default: cube min/max date); days without
+        activity are filled with 0
+
+    Returns:
+    --------
+    dict
+        'keys' (DataFrame, one row per series), 'dates' (DatetimeIndex)
+        and 'values' (float array, series × days)
+    """
+    if level not in PANEL_LEVELS:
+        raise ValueError(f"Unknown panel level: {level}")
+    key_columns = PANEL_LEVELS[level]
+
+    start = pd.Timestamp(start_date) if start_date is not None else cube['date'].min()
+    end = pd.Timestamp(end_date) if end_date is not None else cube['date'].max()
+    dates = pd.date_range(start, end, freq='D')
+
+    cube = cube[(cube['date'] >= start) & (cube['date'] <= end)]
+
+    if key_columns:
+        # Missing keys (the cube keeps them) form their own series
+        grouped = cube.groupby(key_columns, observed=True, sort=True, dropna=False)
+        codes = grouped.ngroup().to_numpy()
+        keys = grouped.size().index.to_frame(index=False)
+    else:
+        codes = np.zeros(len(cube), dtype=np.int64)
+        keys = pd.DataFrame({'series': ['All']})
+
+    day = ((cube['date'] - start) // pd.Timedelta(days=1)).to_numpy()
+    num_series, num_days = len(keys), len(dates)
+    values = np.bincount(codes * num_days + day, weights=cube['total'].to_numpy(dtype=float),
+                         minlength=num_series * num_days).reshape(num_series, num_days)
+
+    print(f"✓ Built {level} daily panel: {num_series:,} series × {num_days} days")
+    return {'keys': keys, 'dates': dates, 'values': values}
+
+# ============================================================================
+# ROLLING STATISTICS (all series at once, along axis 1)
+# ============================================================================
+
+def _rolling_sums(values, window):
+    """Trailing-window sums and observation counts via cumulative sums"""
+    csum = np.cumsum(values, axis=1)
+    lagged = np.zeros_like(csum)
+    lagged[:, window:] = csum[:, :-window]
+    counts = np.minimum(np.arange(1, values.shape[1] + 1), window)
+    return csum - lagged, counts
+
+def rolling_mean(values, window=7):
+    """Trailing rolling mean (partial windows at the start)"""
+    sums, counts = _rolling_sums(values, window)
+    return sums / counts
+
+def rolling_std(values, window=7):
+    """Trailing rolling sample standard deviation (NaN for single-day windows)"""
+    sums, counts = _rolling_sums(values, window)
+    sq_sums, _ = _rolling_sums(values ** 2, window)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        var = (sq_sums - sums ** 2 / counts) / (counts - 1)
+    return np.sqrt(np.clip(var, 0, None))
+
+def week_over_week_change(values):
+    """
+    Percentage change of each trailing 7-day total vs the 7 days before
+
+    Returns NaN until two full weeks of history exist or when the previous
+    week had no activity.
+    """
+    sums, _ = _rolling_sums(values, 7)
+    change = np.full(values.shape, np.nan)
+    if values.shape[1] > 13:
+        current, previous = sums[:, 13:], sums[:, 6:-7]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            change[:, 13:] = np.where(previous > 0, (current - previous) / previous * 100, np.nan)
+    return change
+
+def day_of_week_seasonality(values, dates):
+    """
+    Day-of-week index per series (1.0 = average day)
+
+    Returns:
+    --------
+    pandas.DataFrame
+        series × Monday..Sunday
+    """
+    onehot = np.zeros((len(dates), 7))
+    onehot[np.arange(len(dates)), dates.dayofweek] = 1
+    weekday_means = (values @ onehot) / onehot.sum(axis=0).clip(min=1)
+    overall = values.mean(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        index = np.where(overall > 0, weekday_means / overall, np.nan)
+    return pd.DataFrame(index, columns=['Monday', 'Tuesday', 'Wednesday', 'Thursday',
+                                        'Friday', 'Saturday', 'Sunday'])
+
+# ============================================================================
+# ANOMALY DETECTION
+# ============================================================================
+
+def detect_anomalies(values, baseline_days=28, threshold=3.0, min_history=7):
+    """
+    Flag days that deviate from their trailing baseline
+
+    Each day is scored against the mean and standard deviation of the
+    preceding baseline_days (the day itself is excluded). The standard
+    deviation is floored at a Poisson-style sqrt(max(mean, 1)), so a burst
+    after a flat or dormant baseline (zero variance) is still scored.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        series × days panel values
+    baseline_days : int
+        Trailing baseline window
+    threshold : float
+        Absolute z-score above which a day is flagged
+    min_history : int
+        Days of history required before a day can be scored
+
+    Returns:
+    --------
+    tuple
+        (baseline mean, z-scores, boolean flags), each series × days
+    """
+    mean = np.full(values.shape, np.nan)
+    std = np.full(values.shape, np.nan)
+    mean[:, 1:] = rolling_mean(values, baseline_days)[:, :-1]
+    std[:, 1:] = rolling_std(values, baseline_days)[:, :-1]
+
+    history = np.arange(values.shape[1])
+    mean[:, history < min_history] = np.nan
+
+    scale = np.maximum(std, np.sqrt(np.maximum(mean, 1)))
+    z = (values - mean) / scale
+    with np.errstate(invalid='ignore'):
+        flags = np.abs(z) > threshold
+    return mean, z, flags
+
+def anomalies_to_frame(panel, baseline, z, flags):
+    """
+    List flagged days as a tidy table
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Series keys, date, value, baseline, z_score, pct_of_series_total
+        and direction ('spike' or 'drop'), largest |z| first
+    """
+    rows, cols = np.nonzero(flags)
+    values = panel['values']
+    series_totals = values.sum(axis=1)
+
+    result = panel['keys'].iloc[rows].reset_index(drop=True)
+    result['date'] = panel['dates'][cols]
+    result['value'] = values[rows, cols]
+    result['baseline'] = baseline[rows, cols]
+    result['z_score'] = z[rows, cols]
+    result['pct_of_series_total'] = values[rows, cols] / series_totals[rows] * 100
+    result['direction'] = np.where(result['z_score'] > 0, 'spike', 'drop')
+
+    order = np.argsort(-np.abs(result['z_score'].to_numpy()), kind='stable')
+    return result.iloc[order].reset_index(drop=True)
+
+def panel_to_frame(panel, window=7):
+    """
+    Long-format table of a panel with rolling mean and week-over-week change
+
+    Returns:
+    --------
+    pandas.DataFrame
+        One row per series and day
+    """
+    values = panel['values']
+    num_series, num_days = values.shape
+
+    result = panel['keys'].iloc[np.repeat(np.arange(num_series), num_days)].reset_index(drop=True)
+    result['date'] = np.tile(panel['dates'].to_numpy(), num_series)
+    result['total'] = values.ravel()
+    result[f'rolling_mean_{window}d'] = rolling_mean(values, window).ravel()
+    result['wow_change_pct'] = week_over_week_change(values).ravel()
+    return result